@@ -4,23 +4,45 @@ Modern Agent Orchestrator - OpenAI-powered multi-agent coordination.
 Implements Swarm-like agent handoffs, parallel execution, and streaming support.
 """
 
-from typing import Dict, Any, List, Optional, Generator
-from agents.base_agent import BaseAgent, AgentConfig, AgentResponse
+from typing import Dict, Any, List, Optional, Generator, AsyncGenerator, Tuple
+from agents.base_agent import BaseAgent, AgentConfig, AgentResponse, HTTP2_AVAILABLE, HTTP_LIMITS
 from agents.inventory_agent import InventoryAgent
 from agents.operations_agent import OperationsAgent
 from agents.supervisor_agent import SupervisorAgent
 from agents.math_agent import MathAgent
 from agents.quality_agent import QualityAgent
 from agents.document_processor import DocumentProcessor
+from agents.cache_manager import CacheManager
+from agents.conversation_log import ConversationLog
+from agents.knowledge_store import KnowledgeStore
+from agents.rate_limiter import ConcurrencyLimiter
+from collections import deque
 from datetime import datetime
-import logging
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+import asyncio
+import copy
+import threading
+import hashlib
 import json
+import logging
+import time
+
 from config import (
     OPENAI_API_KEY,
     AGENT_MODELS,
     AGENT_TEMPERATURES,
     MAX_TOKENS,
-    ENABLE_STREAMING
+    ENABLE_STREAMING,
+    KNOWLEDGE_BASE_MAX_ENTRIES,
+    MAX_CONCURRENT_LLM_CALLS,
+    OPENAI_RPM_LIMIT,
+    OPENAI_TPM_LIMIT,
+    AGENT_CALL_TIMEOUT,
+    ENABLE_WARM_UP,
+    CONVERSATION_LOG_PATH,
+    KNOWLEDGE_BASE_DB_PATH,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_TTL
 )
 
 
@@ -36,26 +58,107 @@ class AgentOrchestrator:
     - Lean Six Sigma and Pareto analysis
     """
 
-    def __init__(self):
-        """Initialize orchestrator with all agents"""
+    # Batching for streamed synthesis output
+    SYNTHESIS_STREAM_BATCH_SIZE = 8
+    SYNTHESIS_STREAM_FLUSH_SECONDS = 0.05
+
+    # How long a get_system_status() snapshot is reused
+    STATUS_CACHE_TTL_SECONDS = 1.0
+
+    def __init__(self, kb_maxlen: Optional[int] = None):
+        """
+        Initialize orchestrator with all agents.
+
+        Args:
+            kb_maxlen: Entries kept per knowledge-base list
+                (defaults to KNOWLEDGE_BASE_MAX_ENTRIES)
+        """
         self.logger = logging.getLogger(__name__)
 
         # Initialize document processor
         self.document_processor = DocumentProcessor()
 
+        # One pooled async client shared by all agents
+        self.async_client = self._create_async_client()
+
         # Initialize all agents
         self.agents = self._initialize_agents()
 
+        # Agents used on every request, resolved once
+        self._supervisor: SupervisorAgent = self.agents["supervisor"]
+        self._fallback: BaseAgent = self.agents["inventory"]
+
+        # Recent successful answers for exact repeats of a request
+        self._response_cache = CacheManager(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+
+        # Short-lived cache for system and document status, which the UI polls on every rerun
+        self._status_cache = CacheManager(maxsize=2, ttl=self.STATUS_CACHE_TTL_SECONDS)
+
+        # Background event loop for async agent calls (started on first use)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+        # Caps in-flight LLM requests across all concurrent agent calls. Unlike an
+        # asyncio.Semaphore it is not bound to one loop, so agents awaited outside
+        # the background loop share the same cap instead of failing
+        self._llm_limiter = ConcurrencyLimiter(MAX_CONCURRENT_LLM_CALLS)
+        for agent in self.agents.values():
+            agent.request_limiter = self._llm_limiter
+
         # Knowledge base for shared context
-        self.knowledge_base = {
-            "conversations": [],
-            "insights": [],
-            "decisions": [],
-            "calculations": []
-        }
+        self.knowledge_base = self._create_knowledge_base(
+            kb_maxlen if kb_maxlen is not None else KNOWLEDGE_BASE_MAX_ENTRIES
+        )
+
+        if ENABLE_WARM_UP:
+            self._warm_up_agents()
 
         self.logger.info("Agent Orchestrator initialized with OpenAI-powered agents + Document Processor")
 
+    def _create_knowledge_base(self, kb_maxlen: int) -> Dict[str, Any]:
+        """
+        Create the knowledge-base lists.
+
+        With KNOWLEDGE_BASE_DB_PATH set, every list is a table in a durable
+        SQLite store, conversations included, so CONVERSATION_LOG_PATH is not
+        used. Otherwise the lists are bounded deques (oldest entries evicted
+        first), and conversations can go to an append-only log via
+        CONVERSATION_LOG_PATH.
+
+        Args:
+            kb_maxlen: Entries kept per in-memory list
+
+        Returns:
+            Dictionary mapping list names to append-able containers
+        """
+        names = ("conversations", "insights", "decisions", "calculations")
+
+        if KNOWLEDGE_BASE_DB_PATH:
+            if CONVERSATION_LOG_PATH:
+                self.logger.warning(
+                    "CONVERSATION_LOG_PATH is ignored because KNOWLEDGE_BASE_DB_PATH is set; "
+                    "conversations are stored in the SQLite knowledge base"
+                )
+            store = KnowledgeStore(KNOWLEDGE_BASE_DB_PATH)
+            return {name: store.table(name) for name in names}
+
+        knowledge_base = {name: deque(maxlen=kb_maxlen) for name in names}
+        if CONVERSATION_LOG_PATH:
+            knowledge_base["conversations"] = ConversationLog(CONVERSATION_LOG_PATH)
+        return knowledge_base
+
+    def _create_async_client(self) -> AsyncOpenAI:
+        """
+        Create the AsyncOpenAI client shared by every agent.
+
+        Sharing one keep-alive connection pool means concurrent agent calls
+        reuse warm connections instead of each agent paying its own
+        connection and TLS setup. HTTP/2 is enabled when the optional h2
+        package is installed.
+        """
+        http_client = DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS)
+        return AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=http_client)
+
     def _initialize_agents(self) -> Dict[str, BaseAgent]:
         """Initialize all specialized agents"""
         agents = {}
@@ -66,45 +169,55 @@ class AgentOrchestrator:
                 name="supervisor",
                 model=AGENT_MODELS["supervisor"],
                 temperature=AGENT_TEMPERATURES["supervisor"],
-                max_tokens=MAX_TOKENS
+                max_tokens=MAX_TOKENS,
+                rpm=OPENAI_RPM_LIMIT,
+                tpm=OPENAI_TPM_LIMIT
             )
-            agents["supervisor"] = SupervisorAgent(supervisor_config, OPENAI_API_KEY)
+            agents["supervisor"] = SupervisorAgent(supervisor_config, OPENAI_API_KEY, async_client=self.async_client)
 
             # Inventory Agent
             inventory_config = AgentConfig(
                 name="inventory",
                 model=AGENT_MODELS["inventory"],
                 temperature=AGENT_TEMPERATURES["inventory"],
-                max_tokens=MAX_TOKENS
+                max_tokens=MAX_TOKENS,
+                rpm=OPENAI_RPM_LIMIT,
+                tpm=OPENAI_TPM_LIMIT
             )
-            agents["inventory"] = InventoryAgent(inventory_config, OPENAI_API_KEY)
+            agents["inventory"] = InventoryAgent(inventory_config, OPENAI_API_KEY, async_client=self.async_client)
 
             # Operations Agent
             operations_config = AgentConfig(
                 name="operations",
                 model=AGENT_MODELS["operations"],
                 temperature=AGENT_TEMPERATURES["operations"],
-                max_tokens=MAX_TOKENS
+                max_tokens=MAX_TOKENS,
+                rpm=OPENAI_RPM_LIMIT,
+                tpm=OPENAI_TPM_LIMIT
             )
-            agents["operations"] = OperationsAgent(operations_config, OPENAI_API_KEY)
+            agents["operations"] = OperationsAgent(operations_config, OPENAI_API_KEY, async_client=self.async_client)
 
             # Math Agent
             math_config = AgentConfig(
                 name="math",
                 model=AGENT_MODELS["math"],
                 temperature=AGENT_TEMPERATURES["math"],
-                max_tokens=MAX_TOKENS
+                max_tokens=MAX_TOKENS,
+                rpm=OPENAI_RPM_LIMIT,
+                tpm=OPENAI_TPM_LIMIT
             )
-            agents["math"] = MathAgent(math_config, OPENAI_API_KEY)
+            agents["math"] = MathAgent(math_config, OPENAI_API_KEY, async_client=self.async_client)
 
             # Quality Agent (Lean Six Sigma + Pareto)
             quality_config = AgentConfig(
                 name="quality",
                 model=AGENT_MODELS.get("quality", "gpt-4o"),
                 temperature=AGENT_TEMPERATURES.get("quality", 0.5),
-                max_tokens=MAX_TOKENS
+                max_tokens=MAX_TOKENS,
+                rpm=OPENAI_RPM_LIMIT,
+                tpm=OPENAI_TPM_LIMIT
             )
-            agents["quality"] = QualityAgent(quality_config, OPENAI_API_KEY)
+            agents["quality"] = QualityAgent(quality_config, OPENAI_API_KEY, async_client=self.async_client)
 
             self.logger.info(f"Initialized {len(agents)} agents successfully (including Quality/Six Sigma agent)")
 
@@ -129,24 +242,33 @@ class AgentOrchestrator:
             self.logger.info(f"Processing query: {query[:100]}...")
 
             # Step 1: Use supervisor to route the query
-            routing_result = self.agents["supervisor"].route_query(query)
-            primary_agent = routing_result
+            primary_agent = self._supervisor.route_query(query)
 
             self.logger.info(f"Routed to: {primary_agent}")
 
-            # Step 2: Process with primary agent
-            if primary_agent in self.agents:
-                response = self.agents[primary_agent].process(query, context)
+            # Step 2: Reuse a recent answer to the identical request (same history) if there is one
+            agent = self.agents.get(primary_agent, self._fallback)
+            cache_key = self._response_cache_key(
+                primary_agent, query, context, tuple(agent.conversation_history)
+            )
+            response = self._response_cache.get(cache_key)
+
+            if response is None:
+                # Process with primary agent (falls back to inventory agent)
+                response = agent.process(query, context)
+                if not response.metadata.get("error"):
+                    self._response_cache.put(cache_key, copy.deepcopy(response))
             else:
-                # Fallback to inventory agent
-                response = self.agents["inventory"].process(query, context)
+                self.logger.info("Response cache hit")
+                # Record the exchange as if the agent had answered, and hand out a private copy
+                agent.record_exchange(query, response.content)
+                response = copy.deepcopy(response)
 
-            # Step 3: Store in knowledge base
+            # Step 3: Store in knowledge base (metadata only, to keep memory bounded)
             self.knowledge_base["conversations"].append({
-                "query": query,
+                "query_hash": hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest(),
                 "agent": primary_agent,
-                "response": response.content,
-                "timestamp": datetime.now().isoformat()
+                "timestamp_ns": time.time_ns()  # Formatted only when read
             })
 
             return response
@@ -159,6 +281,40 @@ class AgentOrchestrator:
                 metadata={"error": True}
             )
 
+    def _response_cache_key(
+        self,
+        agent_name: str,
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        history: Tuple[Dict[str, Any], ...] = ()
+    ) -> str:
+        """
+        Build the response cache key for an agent, query, context and history.
+
+        Args:
+            agent_name: Agent that will answer
+            query: User query
+            context: Optional context
+            history: The agent's conversation history, so follow-ups in a
+                different conversation never share an answer
+
+        Returns:
+            Hex digest identifying the request
+        """
+        key = hashlib.blake2b(digest_size=16)
+        key.update(agent_name.encode("utf-8"))
+        key.update(b"\0")
+        key.update(query.encode("utf-8"))
+        if context:
+            key.update(b"\0")
+            key.update(json.dumps(context, sort_keys=True, default=str).encode("utf-8"))
+        for exchange in history:
+            key.update(b"\1")
+            key.update(exchange["user"].encode("utf-8"))
+            key.update(b"\0")
+            key.update(exchange["assistant"].encode("utf-8"))
+        return key.hexdigest()
+
     def process_query_stream(
         self,
         query: str,
@@ -182,17 +338,85 @@ class AgentOrchestrator:
                 return
 
             # Route the query
-            routing_result = self.agents["supervisor"].route_query(query)
-            primary_agent = routing_result
+            primary_agent = self._supervisor.route_query(query)
 
-            # Stream from primary agent
-            if primary_agent in self.agents:
-                for chunk in self.agents[primary_agent].process_stream(query, context):
-                    yield chunk
-            else:
-                # Fallback
-                for chunk in self.agents["inventory"].process_stream(query, context):
-                    yield chunk
+            # Stream from primary agent (falls back to inventory agent)
+            for chunk in self.agents.get(primary_agent, self._fallback).process_stream(query, context):
+                yield chunk
+
+        except Exception as e:
+            self.logger.error(f"Error in streaming: {str(e)}")
+            yield f"Error: {str(e)}"
+
+    async def aprocess_query_stream(
+        self,
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        agent_name: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        Process query with streaming response without blocking the event loop.
+
+        Async counterpart of process_query_stream() for async consumers such as
+        FastAPI streaming responses. The agent call itself runs on the
+        orchestrator's background loop, where the shared AsyncOpenAI pool and
+        the concurrency limit live, and chunks are handed to the caller's loop
+        through a queue.
+
+        Args:
+            query: User query
+            context: Optional context
+            agent_name: Agent to answer; routed by the supervisor when omitted
+
+        Yields:
+            Response chunks as they arrive
+        """
+        caller_loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        def put(item: Any) -> None:
+            caller_loop.call_soon_threadsafe(chunks.put_nowait, item)
+
+        async def produce() -> None:
+            try:
+                async for chunk in self._astream_agent(query, context, agent_name):
+                    put(chunk)
+            finally:
+                put(done)
+
+        future = asyncio.run_coroutine_threadsafe(produce(), self._get_loop())
+        try:
+            while True:
+                chunk = await chunks.get()
+                if chunk is done:
+                    break
+                yield chunk
+        finally:
+            # Stop the agent call if the consumer went away early
+            future.cancel()
+
+    async def _astream_agent(
+        self,
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        agent_name: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        """Stream one agent's answer (runs on the orchestrator loop)"""
+        try:
+            if agent_name is None:
+                # Routing is keyword scoring, not an LLM call, so it runs inline
+                agent_name = self._supervisor.route_query(query)
+            agent = self.agents.get(agent_name, self._fallback)
+
+            if not ENABLE_STREAMING:
+                # Fall back to non-streaming
+                response = await agent.aprocess(query, context)
+                yield response.content
+                return
+
+            async for chunk in agent.aprocess_stream(query, context):
+                yield chunk
 
         except Exception as e:
             self.logger.error(f"Error in streaming: {str(e)}")
@@ -207,6 +431,30 @@ class AgentOrchestrator:
         """
         Process query with explicit agent handoffs (Swarm pattern).
 
+        Synchronous wrapper around aprocess_with_handoff().
+
+        Args:
+            query: User query
+            initial_agent: Starting agent name
+            context: Optional context
+
+        Returns:
+            Dictionary with final response and handoff history
+        """
+        return self._run_async(self.aprocess_with_handoff(query, initial_agent, context))
+
+    async def aprocess_with_handoff(
+        self,
+        query: str,
+        initial_agent: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Process query with explicit agent handoffs (Swarm pattern).
+
+        The agent call goes through the shared LLM request limiter, so concurrent
+        handoff requests are bounded together with multi-agent calls.
+
         Args:
             query: User query
             initial_agent: Starting agent name
@@ -217,32 +465,29 @@ class AgentOrchestrator:
         """
         handoff_history = []
         current_agent = initial_agent
-        max_handoffs = 5  # Prevent infinite loops
 
         try:
-            for i in range(max_handoffs):
-                # Process with current agent
-                response = self.agents[current_agent].process(query, context)
-
-                # Record handoff
-                handoff_history.append({
-                    "agent": current_agent,
-                    "response": response.content,
-                    "timestamp": datetime.now().isoformat()
-                })
-
-                # Check if handoff is needed
-                # (This is a simplified version - in production, agents would
-                # explicitly signal handoffs in their responses)
-                if len(handoff_history) == 1 and current_agent == "supervisor":
-                    # Supervisor routes to appropriate agent
-                    next_agent = self.agents["supervisor"].route_query(query)
-                    if next_agent != current_agent and next_agent in self.agents:
-                        current_agent = next_agent
-                        continue
-
-                # No more handoffs needed
-                break
+            # Only the supervisor hands off today (in production, agents would
+            # explicitly signal handoffs in their responses). Its routing is
+            # decided without an LLM call, so resolve it up front and make a
+            # single call to the agent that actually answers.
+            if current_agent == "supervisor":
+                next_agent = self._supervisor.route_query(query)
+                if next_agent != current_agent and next_agent in self.agents:
+                    handoff_history.append({
+                        "agent": current_agent,
+                        "response": f"Routed to {next_agent} agent",
+                        "timestamp": datetime.now().isoformat()
+                    })
+                    current_agent = next_agent
+
+            response = await self._acall_agent(current_agent, query, context)
+
+            handoff_history.append({
+                "agent": current_agent,
+                "response": response.content,
+                "timestamp": datetime.now().isoformat()
+            })
 
             return {
                 "final_response": handoff_history[-1]["response"],
@@ -257,6 +502,38 @@ class AgentOrchestrator:
                 "handoff_history": handoff_history
             }
 
+    async def _acall_agent(
+        self,
+        agent_name: str,
+        query: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AgentResponse:
+        """
+        Run one agent call under the overall time budget.
+
+        The shared concurrency limit is applied by the agent to each API
+        request, after any rate-limit wait, so slots are not held while
+        waiting on the token buckets or running tools.
+
+        Args:
+            agent_name: Name of the agent to call
+            query: User query
+            context: Optional context
+
+        Returns:
+            Agent response
+
+        Raises:
+            TimeoutError: If the agent does not answer within AGENT_CALL_TIMEOUT seconds
+        """
+        try:
+            return await asyncio.wait_for(
+                self.agents[agent_name].aprocess(query, context),
+                timeout=AGENT_CALL_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"{agent_name} agent timed out after {AGENT_CALL_TIMEOUT}s")
+
     def process_multi_agent(
         self,
         query: str,
@@ -266,6 +543,8 @@ class AgentOrchestrator:
         """
         Process query with multiple agents in parallel.
 
+        Synchronous wrapper around aprocess_multi_agent().
+
         Args:
             query: User query
             agents: List of agent names to consult
@@ -274,23 +553,120 @@ class AgentOrchestrator:
         Returns:
             Dictionary mapping agent names to responses
         """
-        responses = {}
+        return self._run_async(self.aprocess_multi_agent(query, agents, context))
 
-        for agent_name in agents:
-            if agent_name in self.agents:
-                try:
-                    response = self.agents[agent_name].process(query, context)
-                    responses[agent_name] = response
-                except Exception as e:
-                    self.logger.error(f"Error processing with {agent_name}: {str(e)}")
-                    responses[agent_name] = AgentResponse(
-                        content=f"Error: {str(e)}",
-                        agent_name=agent_name,
-                        metadata={"error": True}
-                    )
+    async def aprocess_multi_agent(
+        self,
+        query: str,
+        agents: List[str],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, AgentResponse]:
+        """
+        Process query with multiple agents concurrently.
+
+        All agent LLM calls are awaited together, so the total wall time is
+        roughly that of the slowest agent rather than the sum of all of them.
+
+        Args:
+            query: User query
+            agents: List of agent names to consult
+            context: Optional context
+
+        Returns:
+            Dictionary mapping agent names to responses
+        """
+        agent_names = [name for name in agents if name in self.agents]
+
+        results = await asyncio.gather(
+            *(self._acall_agent(name, query, context) for name in agent_names),
+            return_exceptions=True
+        )
+
+        responses = {}
+        for agent_name, result in zip(agent_names, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error processing with {agent_name}: {str(result)}")
+                responses[agent_name] = AgentResponse(
+                    content=f"Error: {str(result)}",
+                    agent_name=agent_name,
+                    metadata={"error": True}
+                )
+            else:
+                responses[agent_name] = result
 
         return responses
 
+    def _run_async(self, coro):
+        """
+        Run a coroutine on the orchestrator's background event loop and wait for it.
+
+        A single long-lived loop is used instead of asyncio.run() per call because
+        the agents' AsyncOpenAI connection pools are bound to the loop they were
+        first used on.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop, starting it on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="orchestrator-event-loop",
+                    daemon=True
+                ).start()
+
+        return self._loop
+
+    def _warm_up_agents(self):
+        """
+        Warm up API connections in the background without blocking init.
+
+        Every agent shares one sync client (used by process_query and the
+        Streamlit UI) and one async client (used by multi-agent and streamed
+        calls). A pool serves a single host, so one request per client is
+        enough to open its connection before the first query.
+        """
+        agent = self._fallback
+
+        def warm_up_sync():
+            if agent.warm_up():
+                self.logger.info("Warmed up sync API connection")
+
+        async def warm_up_async():
+            if await agent.awarm_up():
+                self.logger.info("Warmed up async API connection")
+
+        threading.Thread(target=warm_up_sync, name="orchestrator-warm-up", daemon=True).start()
+        asyncio.run_coroutine_threadsafe(warm_up_async(), self._get_loop())
+
+    def _build_synthesis_request(
+        self,
+        query: str,
+        agent_names: List[str],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Consult multiple agents and build the supervisor's synthesis prompt.
+
+        Returns:
+            Tuple of (synthesis prompt, synthesis context)
+        """
+        # Get responses from all agents
+        responses = self.process_multi_agent(query, agent_names, context)
+
+        # Plain-text sections tokenize tighter than indented JSON; the responses
+        # are only in the prompt, so the context carries just the query
+        responses_text = "\n\n".join(
+            f"### Agent: {name}\n{resp.content}" for name, resp in responses.items()
+        )
+
+        synthesis_context = {"query": query}
+
+        prompt = f"Synthesize these responses into a cohesive answer:\n\n{responses_text}"
+        return prompt, synthesis_context
+
     def synthesize_multi_agent_response(
         self,
         query: str,
@@ -308,29 +684,67 @@ class AgentOrchestrator:
         Returns:
             Synthesized response
         """
-        # Get responses from all agents
-        responses = self.process_multi_agent(query, agent_names, context)
-
-        # Convert to simple dict for synthesis
-        response_dict = {
-            name: resp.content for name, resp in responses.items()
-        }
+        prompt, synthesis_context = self._build_synthesis_request(query, agent_names, context)
 
         # Use supervisor to synthesize
-        synthesis_context = {
-            "responses": response_dict,
-            "query": query
-        }
-
-        synthesis = self.agents["supervisor"].process(
-            f"Synthesize these responses into a cohesive answer:\n\n{json.dumps(response_dict, indent=2)}",
-            synthesis_context
-        )
+        synthesis = self._supervisor.process(prompt, synthesis_context)
 
         return synthesis.content
 
+    def synthesize_multi_agent_response_stream(
+        self,
+        query: str,
+        agent_names: List[str],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Generator[str, None, None]:
+        """
+        Streaming version of synthesize_multi_agent_response().
+
+        Agent responses are gathered first, then the supervisor's synthesis is
+        streamed. Tokens are yielded in small batches (every
+        SYNTHESIS_STREAM_BATCH_SIZE chunks or SYNTHESIS_STREAM_FLUSH_SECONDS,
+        whichever comes first) to keep output smooth without per-token overhead.
+
+        Args:
+            query: User query
+            agent_names: List of agents to consult
+            context: Optional context
+
+        Yields:
+            Synthesized response text as it arrives
+        """
+        prompt, synthesis_context = self._build_synthesis_request(query, agent_names, context)
+
+        buffer = []
+        last_flush = time.monotonic()
+
+        for chunk in self._supervisor.process_stream(prompt, synthesis_context):
+            buffer.append(chunk)
+            now = time.monotonic()
+            if (len(buffer) >= self.SYNTHESIS_STREAM_BATCH_SIZE
+                    or now - last_flush >= self.SYNTHESIS_STREAM_FLUSH_SECONDS):
+                yield "".join(buffer)
+                buffer.clear()
+                last_flush = now
+
+        if buffer:
+            yield "".join(buffer)
+
     def get_system_status(self) -> Dict[str, Any]:
-        """Get status of all agents and system"""
+        """
+        Get status of all agents and system.
+
+        Snapshots are reused for STATUS_CACHE_TTL_SECONDS so frequent polling
+        does not rebuild the status on every call.
+        """
+        status = self._status_cache.get("status")
+        if status is None:
+            status = self._build_system_status()
+            self._status_cache.put("status", status)
+        return status
+
+    def _build_system_status(self) -> Dict[str, Any]:
+        """Build a fresh status snapshot of all agents and system"""
         return {
             "agents": {
                 name: agent.get_status()
@@ -348,12 +762,46 @@ class AgentOrchestrator:
             "timestamp": datetime.now().isoformat()
         }
 
+    def _invalidate_caches(self):
+        """Drop cached responses and status snapshots after a state change"""
+        self._response_cache.clear()
+        self._status_cache.clear()
+
     def reset_all_conversations(self):
         """Reset conversation history for all agents"""
         for agent in self.agents.values():
             agent.reset_conversation()
+        self._invalidate_caches()
         self.logger.info("All agent conversations reset")
 
+    def close(self):
+        """
+        Close the shared async client, stop the background event loop, shut
+        down the document processor's worker pool and close the
+        knowledge-base backends (committing any pending rows).
+
+        The agents' sync client is shared process-wide and stays open.
+
+        Call once at shutdown; the orchestrator cannot be used afterwards.
+        """
+        if self._loop is not None:
+            self._run_async(self.async_client.close())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+        self.document_processor.close()
+
+        # SQLite tables share one store; deques have nothing to close
+        backends = {}
+        for container in self.knowledge_base.values():
+            backend = getattr(container, "store", container)
+            if hasattr(backend, "close"):
+                backends[id(backend)] = backend
+        for backend in backends.values():
+            backend.close()
+
+        self.logger.info("Agent Orchestrator closed")
+
     def get_agent(self, agent_name: str) -> Optional[BaseAgent]:
         """Get a specific agent by name"""
         return self.agents.get(agent_name)
@@ -373,28 +821,30 @@ class AgentOrchestrator:
         self.logger.info(f"Processing {len(file_paths)} documents...")
 
         results = self.document_processor.process_multiple_files(file_paths)
+        self._invalidate_caches()
 
         # Add document context to knowledge base
         doc_context = self.document_processor.get_combined_context(max_chars=50000)
         if doc_context:
             self.knowledge_base["document_context"] = doc_context
 
-        successful = sum(1 for doc in results if doc.success)
-        failed = len(results) - successful
+        # Summarize results in a single pass
+        documents = []
+        successful = 0
+        for doc in results:
+            successful += doc.success
+            documents.append({
+                "filename": doc.file_name,
+                "success": doc.success,
+                "error": doc.error,
+                "processing_time": doc.processing_time
+            })
 
         return {
             "processed": len(results),
             "successful": successful,
-            "failed": failed,
-            "documents": [
-                {
-                    "filename": doc.file_name,
-                    "success": doc.success,
-                    "error": doc.error,
-                    "processing_time": doc.processing_time
-                }
-                for doc in results
-            ],
+            "failed": len(results) - successful,
+            "documents": documents,
             "context_available": len(doc_context) > 0,
             "statistics": self.document_processor.get_statistics()
         }
@@ -437,12 +887,17 @@ class AgentOrchestrator:
         return self.document_processor.search_documents(query)
 
     def get_document_statistics(self) -> Dict[str, Any]:
-        """Get document processing statistics"""
-        return self.document_processor.get_statistics()
+        """Get document processing statistics (cached like get_system_status)"""
+        stats = self._status_cache.get("documents")
+        if stats is None:
+            stats = self.document_processor.get_statistics()
+            self._status_cache.put("documents", stats)
+        return stats
 
     def clear_document_context(self):
         """Clear all processed documents from context"""
         self.document_processor.clear_context()
+        self._invalidate_caches()
         if "document_context" in self.knowledge_base:
             del self.knowledge_base["document_context"]
         self.logger.info("Document context cleared")
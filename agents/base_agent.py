@@ -6,13 +6,94 @@ OpenAI SDK features including function calling, streaming, and structured output
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Callable, Generator
-from openai import OpenAI
+from typing import Dict, Any, Optional, List, Callable, Generator, AsyncGenerator, Deque, Tuple
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
 from pydantic import BaseModel, Field
-import logging
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+import asyncio
+import importlib.util
+import logging
+import httpx
 import json
 
+from agents.rate_limiter import ConcurrencyLimiter, TokenBucket
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# HTTP/2 lets concurrent requests multiplex over one connection (needs the h2 package)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize to compact JSON text"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize to compact JSON text"""
+        return json.dumps(obj, separators=(",", ":"))
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> OpenAI:
+    """
+    Get the sync OpenAI client for an API key, shared by every agent using it.
+
+    One client means one warm connection pool for all agents instead of a
+    separate pool (and TLS handshakes) per agent.
+    """
+    return OpenAI(
+        api_key=api_key,
+        http_client=DefaultHttpxClient(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS)
+    )
+
+
+@lru_cache(maxsize=16)
+def _get_encoding(model: str):
+    """Get the tiktoken encoding for a model, or None to fall back to estimates"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Unknown model name: use the current default encoding
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # Encoding files could not be loaded (e.g. offline)
+        return None
+
+
+@lru_cache(maxsize=16)
+def _get_rate_limiters(model: str, rpm: int, tpm: int) -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+    """
+    Get the (requests, tokens) buckets for a model, shared by every agent using it.
+
+    OpenAI limits apply per model across the whole account, so agents on the
+    same model draw from the same buckets. A limit of 0 gives no bucket.
+    """
+    return (TokenBucket(rpm) if rpm else None, TokenBucket(tpm) if tpm else None)
+
 
 class AgentConfig(BaseModel):
     """Configuration for an agent"""
@@ -21,6 +102,10 @@ class AgentConfig(BaseModel):
     temperature: float = 0.7
     max_tokens: int = 4096
     stream: bool = False
+    sliding_window: int = Field(5, ge=1, description="Past exchanges kept and sent with each request")
+    context_window: int = Field(128000, description="Model context size in tokens, used to budget history")
+    rpm: int = Field(0, ge=0, description="Requests per minute allowed for the model (0 disables throttling)")
+    tpm: int = Field(0, ge=0, description="Tokens per minute allowed for the model (0 disables throttling)")
 
 
 class Message(BaseModel):
@@ -31,13 +116,20 @@ class Message(BaseModel):
     function_call: Optional[Dict[str, Any]] = Field(None, description="Function call data")
 
 
-class AgentResponse(BaseModel):
-    """Structured response from an agent"""
-    content: str = Field(..., description="Response content")
-    agent_name: str = Field(..., description="Name of the responding agent")
-    function_calls: Optional[List[Dict[str, Any]]] = Field(default_factory=list)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+@dataclass(slots=True)
+class AgentResponse:
+    """
+    Structured response from an agent.
+
+    A plain slotted dataclass rather than a pydantic model: one is built for
+    every agent call and its fields are always set by our own code, so there
+    is nothing to validate.
+    """
+    content: str
+    agent_name: str
+    function_calls: Optional[List[Dict[str, Any]]] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
 class BaseAgent(ABC):
@@ -52,7 +144,16 @@ class BaseAgent(ABC):
     - Agent handoffs and collaboration
     """
 
-    def __init__(self, config: AgentConfig, api_key: str, tools: Optional[List[Dict[str, Any]]] = None):
+    # Tokens held back from the input budget for message framing overhead
+    TOKEN_BUDGET_MARGIN = 512
+
+    def __init__(
+        self,
+        config: AgentConfig,
+        api_key: str,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        async_client: Optional[AsyncOpenAI] = None
+    ):
         """
         Initialize base agent with OpenAI client and configuration.
 
@@ -60,9 +161,14 @@ class BaseAgent(ABC):
             config: Agent configuration
             api_key: OpenAI API key
             tools: Optional list of function definitions for tool calling
+            async_client: Optional shared AsyncOpenAI client (one is created if omitted)
         """
         self.config = config
-        self.client = OpenAI(api_key=api_key)
+        self.client = _get_client(api_key)
+        self.async_client = async_client or AsyncOpenAI(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS)
+        )
         self.tools = tools or []
 
         # Agent state
@@ -74,8 +180,8 @@ class BaseAgent(ABC):
             "total_tokens_used": 0
         }
 
-        # Conversation history
-        self.conversation_history: List[Dict[str, Any]] = []
+        # Conversation history (only the sliding window is kept; older exchanges drop off)
+        self.conversation_history: Deque[Dict[str, Any]] = deque(maxlen=config.sliding_window)
 
         # Setup logging
         self.logger = logging.getLogger(f"agent.{config.name}")
@@ -83,6 +189,24 @@ class BaseAgent(ABC):
         # System prompt - to be defined by subclasses
         self.system_prompt = self._get_system_prompt()
 
+        # Input token budget: room left for prompt + history + input after the reply
+        self._encoding = _get_encoding(config.model)
+        self._input_token_budget = config.context_window - config.max_tokens - self.TOKEN_BUDGET_MARGIN
+        self._system_prompt_tokens = self._count_tokens(self.system_prompt)
+
+        # Client-side rate limits, shared with other agents on the same model
+        self._rpm_bucket, self._tpm_bucket = _get_rate_limiters(config.model, config.rpm, config.tpm)
+
+        # Optional cap on in-flight async API requests (set by the orchestrator).
+        # Only the request itself holds a slot: rate-limit waits and tool calls do not.
+        # The limiter works from any event loop, but an orchestrator's shared async
+        # client does not: await its agents through AgentOrchestrator._run_async()
+        self.request_limiter: Optional[ConcurrencyLimiter] = None
+
+        # Tool definitions are static per agent, so build them once
+        self._tools = self._get_tools() or None
+        self._tool_choice = "auto" if self._tools else None
+
     @abstractmethod
     def _get_system_prompt(self) -> str:
         """
@@ -114,17 +238,15 @@ class BaseAgent(ABC):
             # Build messages
             messages = self._build_messages(input_data, context)
 
-            # Get tools for this request
-            tools = self._get_tools() if self._get_tools() else None
-
             # Make API call
+            self._throttle(messages)
             response = self.client.chat.completions.create(
                 model=self.config.model,
                 messages=messages,
                 temperature=self.config.temperature,
                 max_tokens=self.config.max_tokens,
-                tools=tools,
-                tool_choice="auto" if tools else None
+                tools=self._tools,
+                tool_choice=self._tool_choice
             )
 
             # Extract response
@@ -133,26 +255,10 @@ class BaseAgent(ABC):
             # Handle function calls
             function_calls = []
             if message.tool_calls:
-                for tool_call in message.tool_calls:
-                    function_name = tool_call.function.name
-                    function_args = json.loads(tool_call.function.arguments)
-
-                    # Execute the function
-                    result = self._execute_function(function_name, function_args)
-                    function_calls.append({
-                        "function": function_name,
-                        "arguments": function_args,
-                        "result": result
-                    })
-
-                    # Add function result to conversation
-                    messages.append({
-                        "role": "function",
-                        "name": function_name,
-                        "content": json.dumps(result)
-                    })
+                function_calls = self._run_tool_calls(message.tool_calls, messages)
 
                 # Get final response after function execution
+                self._throttle(messages)
                 final_response = self.client.chat.completions.create(
                     model=self.config.model,
                     messages=messages,
@@ -166,34 +272,179 @@ class BaseAgent(ABC):
                 content = message.content or ""
                 self.state["total_tokens_used"] += response.usage.total_tokens
 
-            # Update state
-            self.state["queries_processed"] += 1
-            self.state["last_activity"] = datetime.now().isoformat()
+            return self._finalize_response(input_data, content, function_calls, response)
 
-            # Store in conversation history
-            self.conversation_history.append({
-                "user": input_data,
-                "assistant": content,
-                "timestamp": datetime.now().isoformat()
-            })
+        except Exception as e:
+            self.logger.error(f"Error processing request: {str(e)}")
+            return self._error_response(e)
 
-            return AgentResponse(
-                content=content,
-                agent_name=self.config.name,
-                function_calls=function_calls,
-                metadata={
-                    "tokens_used": response.usage.total_tokens,
-                    "model": self.config.model
-                }
-            )
+    async def aprocess(self, input_data: str, context: Optional[Dict[str, Any]] = None) -> AgentResponse:
+        """
+        Asynchronous version of process() using the AsyncOpenAI client.
+
+        Awaiting several agents' aprocess() calls together (e.g. with
+        asyncio.gather) overlaps their LLM round-trips instead of running
+        them one after another. Agents built by AgentOrchestrator share an
+        async client bound to its background loop, so run their calls
+        through AgentOrchestrator._run_async() rather than another loop.
+
+        Args:
+            input_data: User input to process
+            context: Optional context dictionary
+
+        Returns:
+            AgentResponse with the result
+        """
+        try:
+            messages = self._build_messages(input_data, context)
+
+            await self._athrottle(messages)
+            async with self.request_limiter or nullcontext():
+                response = await self.async_client.chat.completions.create(
+                    model=self.config.model,
+                    messages=messages,
+                    temperature=self.config.temperature,
+                    max_tokens=self.config.max_tokens,
+                    tools=self._tools,
+                    tool_choice=self._tool_choice
+                )
+
+            message = response.choices[0].message
+
+            function_calls = []
+            if message.tool_calls:
+                function_calls = await self._arun_tool_calls(message.tool_calls, messages)
+
+                await self._athrottle(messages)
+                async with self.request_limiter or nullcontext():
+                    final_response = await self.async_client.chat.completions.create(
+                        model=self.config.model,
+                        messages=messages,
+                        temperature=self.config.temperature,
+                        max_tokens=self.config.max_tokens
+                    )
+
+                content = final_response.choices[0].message.content
+                self.state["total_tokens_used"] += final_response.usage.total_tokens
+            else:
+                content = message.content or ""
+                self.state["total_tokens_used"] += response.usage.total_tokens
+
+            return self._finalize_response(input_data, content, function_calls, response)
 
         except Exception as e:
             self.logger.error(f"Error processing request: {str(e)}")
-            return AgentResponse(
-                content=f"Error: {str(e)}",
-                agent_name=self.config.name,
-                metadata={"error": True}
-            )
+            return self._error_response(e)
+
+    def _run_tool_calls(self, tool_calls: List[Any], messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute the tool calls requested by the model.
+
+        Function results are appended to messages so the follow-up
+        completion can see them.
+
+        Args:
+            tool_calls: Tool calls from the model response
+            messages: Message list for the current request
+
+        Returns:
+            List of executed function calls with their results
+        """
+        calls = [(tc.function.name, _json_loads(tc.function.arguments)) for tc in tool_calls]
+        results = [self._execute_function(name, args) for name, args in calls]
+        return self._record_tool_results(calls, results, messages)
+
+    async def _arun_tool_calls(self, tool_calls: List[Any], messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute the tool calls requested by the model concurrently.
+
+        Each function runs in a worker thread, so several tool calls take as
+        long as the slowest one and the event loop stays free meanwhile.
+        Results are appended to messages in the order the model requested them.
+
+        Args:
+            tool_calls: Tool calls from the model response
+            messages: Message list for the current request
+
+        Returns:
+            List of executed function calls with their results
+        """
+        calls = [(tc.function.name, _json_loads(tc.function.arguments)) for tc in tool_calls]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._execute_function, name, args) for name, args in calls)
+        )
+        return self._record_tool_results(calls, results, messages)
+
+    def _record_tool_results(
+        self,
+        calls: List[Any],
+        results: List[Any],
+        messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Add function results to the conversation and list the executed calls"""
+        function_calls = []
+        for (function_name, function_args), result in zip(calls, results):
+            function_calls.append({
+                "function": function_name,
+                "arguments": function_args,
+                "result": result
+            })
+
+            # Add function result to conversation
+            messages.append({
+                "role": "function",
+                "name": function_name,
+                "content": _json_dumps(result)
+            })
+
+        return function_calls
+
+    def _finalize_response(
+        self,
+        input_data: str,
+        content: str,
+        function_calls: List[Dict[str, Any]],
+        response: Any
+    ) -> AgentResponse:
+        """Update state and history after a completed request and build the response"""
+        self.record_exchange(input_data, content)
+
+        return AgentResponse(
+            content=content,
+            agent_name=self.config.name,
+            function_calls=function_calls,
+            metadata={
+                "tokens_used": response.usage.total_tokens,
+                "model": self.config.model
+            }
+        )
+
+    def record_exchange(self, input_data: str, content: str) -> None:
+        """
+        Count a completed exchange and add it to the conversation history.
+
+        Args:
+            input_data: User input
+            content: Assistant reply
+        """
+        # Update state
+        self.state["queries_processed"] += 1
+        self.state["last_activity"] = datetime.now().isoformat()
+
+        # Store in conversation history
+        self.conversation_history.append({
+            "user": input_data,
+            "assistant": content,
+            "timestamp": datetime.now().isoformat()
+        })
+
+    def _error_response(self, error: Exception) -> AgentResponse:
+        """Build the AgentResponse returned when a request fails"""
+        return AgentResponse(
+            content=f"Error: {str(error)}",
+            agent_name=self.config.name,
+            metadata={"error": True}
+        )
 
     def process_stream(self, input_data: str, context: Optional[Dict[str, Any]] = None) -> Generator[str, None, None]:
         """
@@ -209,6 +460,7 @@ class BaseAgent(ABC):
         try:
             messages = self._build_messages(input_data, context)
 
+            self._throttle(messages)
             stream = self.client.chat.completions.create(
                 model=self.config.model,
                 messages=messages,
@@ -217,22 +469,57 @@ class BaseAgent(ABC):
                 stream=True
             )
 
-            full_response = ""
+            parts = []
             for chunk in stream:
                 if chunk.choices[0].delta.content:
                     content = chunk.choices[0].delta.content
-                    full_response += content
+                    parts.append(content)
                     yield content
 
-            # Update state after streaming completes
-            self.state["queries_processed"] += 1
-            self.state["last_activity"] = datetime.now().isoformat()
+            self.record_exchange(input_data, "".join(parts))
 
-            self.conversation_history.append({
-                "user": input_data,
-                "assistant": full_response,
-                "timestamp": datetime.now().isoformat()
-            })
+        except Exception as e:
+            self.logger.error(f"Error in streaming: {str(e)}")
+            yield f"Error: {str(e)}"
+
+    async def aprocess_stream(
+        self,
+        input_data: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        Process input with streaming response without blocking the event loop.
+
+        Async counterpart of process_stream() using the shared AsyncOpenAI client.
+
+        Args:
+            input_data: User input to process
+            context: Optional context dictionary
+
+        Yields:
+            Response chunks as they arrive
+        """
+        try:
+            messages = self._build_messages(input_data, context)
+
+            await self._athrottle(messages)
+            parts = []
+            async with self.request_limiter or nullcontext():
+                stream = await self.async_client.chat.completions.create(
+                    model=self.config.model,
+                    messages=messages,
+                    temperature=self.config.temperature,
+                    max_tokens=self.config.max_tokens,
+                    stream=True
+                )
+
+                async for chunk in stream:
+                    if chunk.choices[0].delta.content:
+                        content = chunk.choices[0].delta.content
+                        parts.append(content)
+                        yield content
+
+            self.record_exchange(input_data, "".join(parts))
 
         except Exception as e:
             self.logger.error(f"Error in streaming: {str(e)}")
@@ -249,23 +536,77 @@ class BaseAgent(ABC):
         Returns:
             List of message dictionaries
         """
+        # The system prompt is built once and must stay the first message: an
+        # unchanged prefix lets the API's automatic prompt caching reuse it
         messages = [{"role": "system", "content": self.system_prompt}]
 
-        # Add relevant conversation history (last 5 exchanges)
-        for exchange in self.conversation_history[-5:]:
-            messages.append({"role": "user", "content": exchange["user"]})
-            messages.append({"role": "assistant", "content": exchange["assistant"]})
-
-        # Add context if provided
+        # Context goes in its own message after the history rather than into the
+        # user input, so the system prompt and history stay an unchanged prefix
+        context_message = None
         if context:
-            context_str = f"\nContext: {json.dumps(context, indent=2)}"
-            input_data = input_data + context_str
+            context_message = {
+                "role": "system",
+                "name": "context",
+                "content": "Context: " + _json_dumps(context)
+            }
+
+        # Add relevant conversation history (the history holds only the sliding
+        # window), newest first until the input token budget is used up
+        budget = self._input_token_budget - self._system_prompt_tokens - self._count_tokens(input_data)
+        if context_message is not None:
+            budget -= self._count_tokens(context_message["content"])
+        history = []
+        for exchange in reversed(self.conversation_history):
+            tokens = exchange.get("tokens")
+            if tokens is None:
+                tokens = self._count_tokens(exchange["user"]) + self._count_tokens(exchange["assistant"])
+                exchange["tokens"] = tokens
+            if tokens > budget:
+                break
+            budget -= tokens
+            history.append(exchange)
+
+        messages.extend(chain.from_iterable(
+            (
+                {"role": "user", "content": exchange["user"]},
+                {"role": "assistant", "content": exchange["assistant"]}
+            )
+            for exchange in reversed(history)
+        ))
+
+        if context_message is not None:
+            messages.append(context_message)
 
         # Add current input
         messages.append({"role": "user", "content": input_data})
 
         return messages
 
+    def _estimate_request_tokens(self, messages: List[Dict[str, Any]]) -> int:
+        """Tokens a request counts against the TPM limit: prompt plus max_tokens"""
+        prompt_tokens = sum(self._count_tokens(m.get("content") or "") for m in messages)
+        return prompt_tokens + self.config.max_tokens
+
+    def _throttle(self, messages: List[Dict[str, Any]]):
+        """Block until the rate limits allow sending messages"""
+        if self._rpm_bucket is not None:
+            self._rpm_bucket.acquire(1)
+        if self._tpm_bucket is not None:
+            self._tpm_bucket.acquire(self._estimate_request_tokens(messages))
+
+    async def _athrottle(self, messages: List[Dict[str, Any]]):
+        """Wait, without blocking the event loop, until the rate limits allow sending messages"""
+        if self._rpm_bucket is not None:
+            await self._rpm_bucket.aacquire(1)
+        if self._tpm_bucket is not None:
+            await self._tpm_bucket.aacquire(self._estimate_request_tokens(messages))
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens with tiktoken, or estimate (~4 characters per token) without it"""
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return len(text) // 4 + 1
+
     def _execute_function(self, function_name: str, arguments: Dict[str, Any]) -> Any:
         """
         Execute a function call.
@@ -281,6 +622,40 @@ class BaseAgent(ABC):
         self.logger.warning(f"Function {function_name} called but not implemented")
         return {"error": f"Function {function_name} not implemented"}
 
+    def warm_up(self) -> bool:
+        """
+        Open a connection on the shared sync client ahead of the first query.
+
+        Uses a model lookup rather than a completion, so no tokens are spent.
+        Failures are logged and otherwise ignored.
+
+        Returns:
+            True if the API answered, False otherwise
+        """
+        try:
+            self.client.models.retrieve(self.config.model)
+            return True
+        except Exception as e:
+            self.logger.debug(f"Warm-up request failed: {str(e)}")
+            return False
+
+    async def awarm_up(self) -> bool:
+        """
+        Open a connection on the async client ahead of the first query.
+
+        Uses a model lookup rather than a completion, so no tokens are spent.
+        Failures are logged and otherwise ignored.
+
+        Returns:
+            True if the API answered, False otherwise
+        """
+        try:
+            await self.async_client.models.retrieve(self.config.model)
+            return True
+        except Exception as e:
+            self.logger.debug(f"Warm-up request failed: {str(e)}")
+            return False
+
     def get_state(self) -> Dict[str, Any]:
         """Get the current state of the agent"""
         return self.state.copy()
@@ -296,7 +671,7 @@ class BaseAgent(ABC):
 
     def reset_conversation(self):
         """Reset the conversation history"""
-        self.conversation_history = []
+        self.conversation_history.clear()
         self.logger.info(f"Conversation history reset for {self.config.name}")
 
     def handoff_to(self, target_agent: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -328,7 +703,7 @@ class BaseAgent(ABC):
         if not self.conversation_history:
             return "No conversation history"
 
-        recent = self.conversation_history[-3:]
+        recent = list(self.conversation_history)[-3:]
         summary = "Recent conversation:\n"
         for exchange in recent:
             summary += f"User: {exchange['user'][:100]}...\n"
@@ -1,6 +1,9 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
+import time
+from collections import defaultdict
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
 
 class CommunicationPattern(Enum):
@@ -8,7 +11,7 @@ class CommunicationPattern(Enum):
     GROUP = "group"
     SEQUENTIAL = "sequential"
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     agent_id: str
     expertise: List[str]
@@ -23,11 +26,29 @@ class CollaborationManager:
     def __init__(self):
         self.agents = {}
         self.active_conversations = {}
+        # expertise -> agent ids (dict keys keep registration order)
+        self._expertise_index: Dict[str, Dict[str, None]] = defaultdict(dict)
         self.logger = logging.getLogger(__name__)
         
     def register_agent(self, agent_id: str, expertise: List[str]) -> None:
         """Register a new agent with its expertise areas."""
+        if agent_id in self.agents:
+            self.deregister_agent(agent_id)
         self.agents[agent_id] = AgentContext(agent_id=agent_id, expertise=expertise)
+        for area in expertise:
+            self._expertise_index[area][agent_id] = None
+
+    def deregister_agent(self, agent_id: str) -> None:
+        """Remove an agent and its expertise areas from the index."""
+        context = self.agents.pop(agent_id, None)
+        if context is None:
+            return
+        for area in context.expertise:
+            agents = self._expertise_index.get(area)
+            if agents is not None:
+                agents.pop(agent_id, None)
+                if not agents:
+                    del self._expertise_index[area]
         
     def create_conversation(self, pattern: CommunicationPattern, participants: List[str]) -> str:
         """Create a new conversation with specified pattern and participants."""
@@ -45,10 +66,12 @@ class CollaborationManager:
         if conv_id not in self.active_conversations:
             raise ValueError(f"Conversation {conv_id} not found")
             
+        ts_ns = time.time_ns()
         message = {
             'from': from_agent,
             'content': content,
-            'timestamp': self.get_timestamp()
+            'timestamp': self.get_timestamp_iso(ts_ns),
+            'ts_ns': ts_ns  # integer form for ordering and arithmetic
         }
         
         self.active_conversations[conv_id]['messages'].append(message)
@@ -69,16 +92,22 @@ class CollaborationManager:
         
     def get_timestamp(self) -> str:
         """Get current timestamp for message tracking."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        return self.get_timestamp_iso()
+
+    @staticmethod
+    def get_timestamp_iso(ts_ns: Optional[int] = None) -> str:
+        """Format a message's ts_ns (or the current time) as a naive UTC ISO string."""
+        if ts_ns is None:
+            ts_ns = time.time_ns()
+        seconds, nanos = divmod(ts_ns, 1_000_000_000)
+        # Same format as datetime.utcnow().isoformat(), without the deprecated call
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
+            tzinfo=None, microsecond=nanos // 1000
+        ).isoformat()
 
     def get_relevant_agents(self, task_type: str) -> List[str]:
         """Find agents with relevant expertise for a task."""
-        relevant_agents = []
-        for agent_id, context in self.agents.items():
-            if task_type in context.expertise:
-                relevant_agents.append(agent_id)
-        return relevant_agents
+        return list(self._expertise_index.get(task_type, ()))
 
     def synthesize_results(self, conv_id: str) -> Dict[str, Any]:
         """Synthesize results from a conversation."""
@@ -1,9 +1,25 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from itertools import compress
+import bisect
+import heapq
 import json
-from datetime import datetime
-from dataclasses import dataclass, asdict
+import logging
+import re
+import time
+from datetime import datetime, timezone
+from dataclasses import dataclass
+import numpy as np
 
-@dataclass
+try:
+    import hnswlib
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_SEARCH_AVAILABLE = True
+except ImportError:
+    SEMANTIC_SEARCH_AVAILABLE = False
+
+_WORD_RE = re.compile(r'\w+')
+
+@dataclass(slots=True)
 class ContextItem:
     type: str
     content: Any
@@ -12,39 +28,156 @@ class ContextItem:
     relevance_score: float = 1.0
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Flat fields: a dict literal avoids asdict()'s recursive deep copy
+        return {
+            'type': self.type,
+            'content': self.content,
+            'timestamp': self.timestamp,
+            'source_agent': self.source_agent,
+            'relevance_score': self.relevance_score
+        }
 
 class ContextManager:
-    def __init__(self):
+    # HNSW parameters for the optional semantic index
+    HNSW_M = 16
+    HNSW_EF_CONSTRUCTION = 200
+    HNSW_EF_SEARCH = 50
+    HNSW_INITIAL_CAPACITY = 1024
+
+    # Highest-relevance items kept in shared knowledge
+    MAX_SHARED_KNOWLEDGE = 1000
+
+    def __init__(self, embedding_model: Optional[str] = None, min_similarity: float = 0.0):
+        """
+        Args:
+            embedding_model: Optional sentence-transformers model name. When set
+                (and hnswlib is installed), relevance uses an ANN index over
+                item embeddings instead of keyword matching.
+            min_similarity: Minimum cosine similarity for semantic matches
+        """
         self.context_store = {}
+        # Lowercased searchable fields per stored item, parallel to context_store
+        self._search_fields = {}
+        # Item timestamps as epoch ns, parallel to context_store; conversations
+        # whose items arrived out of timestamp order are listed in _unordered
+        self._timestamps_ns = {}
+        self._unordered = set()
         self.agent_contexts = {}
+        # Min-heap of (relevance_score, insertion order, item); only the top
+        # MAX_SHARED_KNOWLEDGE items are kept
         self.shared_knowledge = []
+        self._shared_counter = 0
+
+        # Optional semantic index: per-conversation embeddings (source of truth
+        # for rebuilds) and HNSW indexes whose labels are context_store positions
+        self.min_similarity = min_similarity
+        self._encoder = None
+        self._embeddings = {}
+        self._indexes = {}
+        if embedding_model:
+            if SEMANTIC_SEARCH_AVAILABLE:
+                self._encoder = SentenceTransformer(embedding_model)
+            else:
+                logging.getLogger(__name__).warning(
+                    "hnswlib/sentence-transformers not installed; using keyword relevance"
+                )
         
     def add_context(self, conversation_id: str, context_item: ContextItem) -> None:
         """Add a new context item to the conversation."""
         if conversation_id not in self.context_store:
             self.context_store[conversation_id] = []
+            self._search_fields[conversation_id] = []
+            self._timestamps_ns[conversation_id] = []
             
-        self.context_store[conversation_id].append(context_item.to_dict())
+        item = context_item.to_dict()
+        self.context_store[conversation_id].append(item)
+        self._search_fields[conversation_id].append(self._extract_search_fields(item))
+        
+        ts_ns = self._to_ns(context_item.timestamp)
+        timestamps = self._timestamps_ns[conversation_id]
+        if timestamps and ts_ns < timestamps[-1]:
+            self._unordered.add(conversation_id)
+        timestamps.append(ts_ns)
+        if self._encoder is not None:
+            self._add_embedding(conversation_id, str(context_item.content))
         
         # Update shared knowledge if relevance is high
         if context_item.relevance_score > 0.8:
-            self.shared_knowledge.append(context_item.to_dict())
+            entry = (context_item.relevance_score, self._shared_counter, context_item.to_dict())
+            self._shared_counter += 1
+            if len(self.shared_knowledge) < self.MAX_SHARED_KNOWLEDGE:
+                heapq.heappush(self.shared_knowledge, entry)
+            else:
+                heapq.heappushpop(self.shared_knowledge, entry)
+            
+    def get_shared_knowledge(self) -> List[Dict]:
+        """Get shared knowledge items, most relevant first."""
+        return [item for _, _, item in sorted(self.shared_knowledge, key=lambda e: (-e[0], e[1]))]
             
     def get_relevant_context(self, conversation_id: str, query: str, max_items: int = 5) -> List[Dict]:
         """Get context items relevant to the current query."""
         if conversation_id not in self.context_store:
             return []
             
-        # Implement context relevance scoring
-        scored_items = [
-            (item, self._calculate_relevance(item, query))
-            for item in self.context_store[conversation_id]
-        ]
+        if self._encoder is not None:
+            return self._semantic_search(conversation_id, query, max_items)
+            
+        # Score against fields lowercased at insert time; tokenize the query once
+        terms = self._query_terms(query)
+        scored_items = zip(
+            self.context_store[conversation_id],
+            (self._score_fields(fields, terms) for fields in self._search_fields[conversation_id])
+        )
         
-        # Sort by relevance and return top items
-        scored_items.sort(key=lambda x: x[1], reverse=True)
-        return [item for item, score in scored_items[:max_items]]
+        # Keep only the top items (same order as a stable full sort)
+        top_items = heapq.nlargest(max_items, scored_items, key=lambda x: x[1])
+        return [item for item, score in top_items]
+        
+    def _add_embedding(self, conversation_id: str, text: str) -> None:
+        """Embed an item's content and add it to the conversation's ANN index."""
+        embedding = self._encoder.encode(text, normalize_embeddings=True).astype(np.float32)
+        embeddings = self._embeddings.setdefault(conversation_id, [])
+        embeddings.append(embedding)
+        
+        index = self._indexes.get(conversation_id)
+        if index is None:
+            index = self._new_index(len(embedding), self.HNSW_INITIAL_CAPACITY)
+            self._indexes[conversation_id] = index
+        elif index.get_current_count() >= index.get_max_elements():
+            index.resize_index(2 * index.get_max_elements())
+        index.add_items(embedding[np.newaxis, :], [len(embeddings) - 1])
+        
+    def _new_index(self, dim: int, capacity: int):
+        """Create an empty cosine-space HNSW index."""
+        index = hnswlib.Index(space='cosine', dim=dim)
+        index.init_index(max_elements=capacity, ef_construction=self.HNSW_EF_CONSTRUCTION, M=self.HNSW_M)
+        index.set_ef(self.HNSW_EF_SEARCH)
+        return index
+        
+    def _rebuild_index(self, conversation_id: str) -> None:
+        """Rebuild a conversation's ANN index from its stored embeddings."""
+        embeddings = self._embeddings.get(conversation_id)
+        if not embeddings:
+            self._indexes.pop(conversation_id, None)
+            return
+        index = self._new_index(len(embeddings[0]), max(self.HNSW_INITIAL_CAPACITY, len(embeddings)))
+        index.add_items(np.vstack(embeddings), np.arange(len(embeddings)))
+        self._indexes[conversation_id] = index
+        
+    def _semantic_search(self, conversation_id: str, query: str, max_items: int) -> List[Dict]:
+        """Get the items nearest to the query in embedding space."""
+        index = self._indexes.get(conversation_id)
+        if index is None or max_items <= 0:
+            return []
+        k = min(max_items, index.get_current_count())
+        query_embedding = self._encoder.encode(query, normalize_embeddings=True).astype(np.float32)
+        labels, distances = index.knn_query(query_embedding, k=k)
+        items = self.context_store[conversation_id]
+        return [
+            items[label]
+            for label, distance in zip(labels[0], distances[0])
+            if 1.0 - distance >= self.min_similarity
+        ]
         
     def update_agent_context(self, agent_id: str, context_update: Dict) -> None:
         """Update context for a specific agent."""
@@ -59,73 +192,123 @@ class ContextManager:
         
     def merge_contexts(self, context_items: List[Dict]) -> Dict:
         """Merge multiple context items into a consolidated view."""
-        merged = {
-            'summary': [],
-            'key_points': set(),
-            'decisions': [],
-            'timestamp': datetime.utcnow().isoformat()
-        }
+        summary, key_points, decisions = [], set(), []
+        
+        # Bind the bound methods once; the loop does no lookups on the result dict
+        add_key_points = key_points.update
+        add_decisions = decisions.extend
+        add_summary = summary.append
         
         for item in context_items:
-            if 'content' in item:
-                content = item['content']
-                if isinstance(content, dict):
-                    # Extract key points
-                    if 'key_points' in content:
-                        merged['key_points'].update(content['key_points'])
-                    
-                    # Collect decisions
-                    if 'decisions' in content:
-                        merged['decisions'].extend(content['decisions'])
-                        
-                    # Add to summary if relevant
-                    if 'summary' in content:
-                        merged['summary'].append(content['summary'])
-                        
+            content = item.get('content')
+            if not isinstance(content, dict):
+                continue
+            
+            # Extract key points
+            if 'key_points' in content:
+                add_key_points(content['key_points'])
+            
+            # Collect decisions
+            if 'decisions' in content:
+                add_decisions(content['decisions'])
+                
+            # Add to summary if relevant
+            if 'summary' in content:
+                add_summary(content['summary'])
+                
         # Convert set to list for JSON serialization
-        merged['key_points'] = list(merged['key_points'])
+        merged = {
+            'summary': summary,
+            'key_points': list(key_points),
+            'decisions': decisions,
+            'timestamp': datetime.utcnow().isoformat()
+        }
         
         return merged
         
     def _calculate_relevance(self, item: Dict, query: str) -> float:
         """Calculate relevance score between context item and query."""
-        # Implement relevance calculation logic
-        # This is a simplified version - in practice, you might want to use
-        # more sophisticated NLP techniques
+        return self._score_fields(self._extract_search_fields(item), self._query_terms(query))
         
-        relevance = 0.0
+    @staticmethod
+    def _query_terms(query: str) -> Tuple[str, ...]:
+        """Lowercase a query and split it into unique words."""
+        return tuple(dict.fromkeys(_WORD_RE.findall(query.lower())))
+        
+    @staticmethod
+    def _extract_search_fields(item: Dict) -> Tuple[Tuple[str, ...], Optional[str], Optional[str]]:
+        """Lowercase the parts of an item used for relevance scoring."""
+        key_points, summary, text = (), None, None
         if 'content' in item:
             content = item['content']
             if isinstance(content, dict):
-                # Check key points
                 if 'key_points' in content:
-                    for point in content['key_points']:
-                        if any(term in point.lower() for term in query.lower().split()):
-                            relevance += 0.3
-                            
-                # Check summary
+                    key_points = tuple(str(point).lower() for point in content['key_points'])
                 if 'summary' in content:
-                    if any(term in content['summary'].lower() for term in query.lower().split()):
-                        relevance += 0.4
-                        
+                    summary = str(content['summary']).lower()
             elif isinstance(content, str):
-                if any(term in content.lower() for term in query.lower().split()):
-                    relevance += 0.5
-                    
+                text = content.lower()
+        return key_points, summary, text
+        
+    @staticmethod
+    def _score_fields(fields: Tuple[Tuple[str, ...], Optional[str], Optional[str]], terms: Tuple[str, ...]) -> float:
+        """Score pre-lowercased item fields against lowercased query terms."""
+        # This is a simplified version - in practice, you might want to use
+        # more sophisticated NLP techniques
+        key_points, summary, text = fields
+        
+        relevance = 0.0
+        for point in key_points:
+            if any(term in point for term in terms):
+                relevance += 0.3
+                
+        if summary is not None and any(term in summary for term in terms):
+            relevance += 0.4
+            
+        if text is not None and any(term in text for term in terms):
+            relevance += 0.5
+            
         return min(1.0, relevance)
         
     def prune_old_contexts(self, max_age_hours: int = 24) -> None:
         """Remove context items older than specified age."""
-        current_time = datetime.utcnow()
+        cutoff = time.time_ns() - max_age_hours * 3600 * 10**9
         
-        for conv_id in self.context_store:
-            self.context_store[conv_id] = [
-                item for item in self.context_store[conv_id]
-                if self._is_recent(item['timestamp'], current_time, max_age_hours)
-            ]
+        for conv_id, timestamps in self._timestamps_ns.items():
+            if conv_id in self._unordered:
+                self._prune_unordered(conv_id, cutoff)
+                continue
+            
+            # Items are in timestamp order: everything before the cutoff goes
+            idx = bisect.bisect_right(timestamps, cutoff)
+            if not idx:
+                continue
+            del timestamps[:idx]
+            del self.context_store[conv_id][:idx]
+            del self._search_fields[conv_id][:idx]
+            if conv_id in self._embeddings:
+                del self._embeddings[conv_id][:idx]
+                self._rebuild_index(conv_id)
+                
+    def _prune_unordered(self, conv_id: str, cutoff: int) -> None:
+        """Filter a conversation whose items are not in timestamp order."""
+        keep = [ts > cutoff for ts in self._timestamps_ns[conv_id]]
+        if all(keep):
+            return
+        self._timestamps_ns[conv_id] = list(compress(self._timestamps_ns[conv_id], keep))
+        self.context_store[conv_id] = list(compress(self.context_store[conv_id], keep))
+        self._search_fields[conv_id] = list(compress(self._search_fields[conv_id], keep))
+        if conv_id in self._embeddings:
+            self._embeddings[conv_id] = list(compress(self._embeddings[conv_id], keep))
+            self._rebuild_index(conv_id)
+        timestamps = self._timestamps_ns[conv_id]
+        if all(a <= b for a, b in zip(timestamps, timestamps[1:])):
+            self._unordered.discard(conv_id)
             
-    def _is_recent(self, timestamp_str: str, current_time: datetime, max_age_hours: int) -> bool:
-        """Check if a timestamp is within the specified age limit."""
+    @staticmethod
+    def _to_ns(timestamp_str: str) -> int:
+        """Convert an ISO timestamp (naive means UTC) to epoch nanoseconds."""
         item_time = datetime.fromisoformat(timestamp_str)
-        age = current_time - item_time
-        return age.total_seconds() < (max_age_hours * 3600)
+        if item_time.tzinfo is None:
+            item_time = item_time.replace(tzinfo=timezone.utc)
+        return int(item_time.timestamp() * 10**9)
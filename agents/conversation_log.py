@@ -0,0 +1,90 @@
+"""
+Conversation Log - append-only NDJSON storage for conversation history.
+
+Keeps long-running processes from holding every conversation entry in
+memory. Entries are written as one JSON object per line and read back
+through a memory map, so the OS page cache serves reads without copying
+the whole history into Python objects.
+"""
+
+from typing import Any, Dict, Iterator
+import json
+import mmap
+import os
+import threading
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ConversationLog:
+    """
+    Append-only NDJSON log with a deque-like append()/len() interface.
+
+    Features:
+    - One unbuffered write per entry, so each line lands atomically
+    - Zero-copy iteration over the file via mmap
+    - Entry count kept in memory, no scan on status checks
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the log file.
+
+        Args:
+            path: Path to the NDJSON file
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._file = open(path, "ab", buffering=0)
+        self._lock = threading.Lock()
+        self._count = self._count_lines()
+
+    def _count_lines(self) -> int:
+        """Count existing entries (done once, on open)"""
+        with open(self.path, "rb") as f:
+            return sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 20), b""))
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """
+        Append one entry to the log.
+
+        Args:
+            entry: JSON-serializable dictionary
+        """
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+
+        with self._lock:
+            self._file.write(line)
+            self._count += 1
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over logged entries, oldest first, parsing each line on demand"""
+        if os.fstat(self._file.fileno()).st_size == 0:
+            return
+
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            end = mm.find(b"\n", start)
+            while end != -1:
+                if end > start:
+                    yield loads(mm[start:end])
+                start = end + 1
+                end = mm.find(b"\n", start)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """Close the underlying file"""
+        self._file.close()
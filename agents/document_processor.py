@@ -5,23 +5,41 @@ Processes various document formats and adds content to system context
 for agent access. Supports PDF, Word, Excel, PowerPoint, images, and more.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import logging
 from datetime import datetime
+import hashlib
+import importlib.util
 import json
 import os
 import psutil
+import re
+import stat
+import tempfile
+import threading
 
 try:
-    from docling.document_converter import DocumentConverter
-    from docling.datamodel.base_models import InputFormat
-    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+    from docling.datamodel.base_models import ConversionStatus, InputFormat
+    from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
+    from docling.datamodel.settings import settings as docling_settings
+    try:
+        from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+    except ImportError:
+        # Older Docling releases keep these in pipeline_options
+        from docling.datamodel.pipeline_options import AcceleratorDevice, AcceleratorOptions
     DOCLING_AVAILABLE = True
 except ImportError:
     DOCLING_AVAILABLE = False
     logging.warning("Docling not available. Using fallback processors.")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Fallback imports
 try:
     from langchain_community.document_loaders import TextLoader
@@ -39,8 +57,125 @@ except ImportError:
 from dataclasses import dataclass
 from pydantic import BaseModel, Field
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+
+from agents.cache_manager import CacheManager
+
+CPU_COUNT = os.cpu_count() or 1
+
+_WORD_RE = re.compile(r"\w+")
+
+# Docling's perf settings are process-global; batches that change them take turns
+_DOCLING_PERF_LOCK = threading.Lock()
+
+
+def _export_file_mode(path: str) -> int:
+    """Permission bits for rewriting path: its current mode, or 0o666 minus the umask"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _build_converter(throughput_mode: bool = False):
+    """
+    Create a Docling converter for the supported formats.
+
+    Args:
+        throughput_mode: Use the fast TableFormer model instead of the accurate one
+
+    Returns:
+        Configured DocumentConverter
+    """
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.do_ocr = True
+    pipeline_options.do_table_structure = True
+    if throughput_mode:
+        pipeline_options.table_structure_options.mode = TableFormerMode.FAST
+
+    # Run the layout/OCR/table models on a GPU when one is present, and
+    # on every core otherwise (flash attention only if it is installed)
+    pipeline_options.accelerator_options = AcceleratorOptions(
+        num_threads=CPU_COUNT,
+        device=AcceleratorDevice.AUTO,
+        cuda_use_flash_attention2=importlib.util.find_spec("flash_attn") is not None
+    )
+
+    return DocumentConverter(
+        allowed_formats=[
+            InputFormat.PDF,
+            InputFormat.DOCX,
+            InputFormat.PPTX,
+            InputFormat.IMAGE,
+            InputFormat.HTML,
+            InputFormat.MD,
+        ],
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+
 
-@dataclass
+def _extract_docling_result(result) -> Dict[str, Any]:
+    """Pull content, tables and document metadata out of a Docling result"""
+    document = result.document
+
+    # Extract tables if present
+    tables = []
+    if hasattr(document, 'tables') and document.tables:
+        for i, table in enumerate(document.tables):
+            try:
+                tables.append({
+                    "id": i,
+                    "markdown": str(table),
+                    "row_count": getattr(table, 'row_count', 0)
+                })
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"Error extracting table {i}: {e}")
+
+    return {
+        "content": document.export_to_markdown(),
+        "tables": tables,
+        "page_count": getattr(document, 'page_count', 0),
+        "language": getattr(document, 'language', 'unknown')
+    }
+
+
+# Converter owned by a worker process of the Docling process pool
+_worker_converter = None
+
+
+def _worker_convert(task: Tuple[str, bool]) -> Tuple[str, Optional[Dict[str, Any]], str]:
+    """
+    Convert one file in a process-pool worker.
+
+    The worker builds its converter on first use and keeps it for later
+    files. Only picklable data is returned to the parent.
+
+    Args:
+        task: (file path, throughput_mode)
+
+    Returns:
+        (file path, extracted result or None on failure, error message)
+    """
+    global _worker_converter
+    path_str, throughput_mode = task
+    try:
+        if _worker_converter is None:
+            _worker_converter = _build_converter(throughput_mode)
+        result = _worker_converter.convert(path_str, raises_on_error=False)
+        if result.status != ConversionStatus.SUCCESS:
+            return path_str, None, f"conversion status {result.status}"
+        return path_str, _extract_docling_result(result), ""
+    except Exception as e:
+        return path_str, None, str(e)
+
+
+@dataclass(slots=True)
 class ProcessingResult:
     """Legacy processing result for backward compatibility"""
     success: bool
@@ -76,33 +211,53 @@ class DocumentProcessor:
     - Search capabilities
     """
 
-    def __init__(self):
-        """Initialize document processor"""
-        self.logger = logging.getLogger(__name__)
+    # Parsed documents kept for files that haven't changed since
+    DOCUMENT_CACHE_SIZE = 128
 
-        # Initialize Docling if available
-        if DOCLING_AVAILABLE:
-            try:
-                pipeline_options = PdfPipelineOptions()
-                pipeline_options.do_ocr = True
-                pipeline_options.do_table_structure = True
-
-                self.converter = DocumentConverter(
-                    allowed_formats=[
-                        InputFormat.PDF,
-                        InputFormat.DOCX,
-                        InputFormat.PPTX,
-                        InputFormat.IMAGE,
-                        InputFormat.HTML,
-                        InputFormat.MD,
-                    ]
-                )
-                self.logger.info("Docling converter initialized successfully")
-            except Exception as e:
-                self.logger.warning(f"Failed to initialize Docling: {e}. Using fallback.")
-                self.converter = None
-        else:
-            self.converter = None
+    # Text files above this size only get a sample of their head in context
+    LARGE_TEXT_FILE_MB = 50
+    LARGE_TEXT_SAMPLE_CHARS = 1_000_000
+
+    # get_system_stats() results are reused for this long
+    SYSTEM_STATS_TTL_SECONDS = 1.0
+
+    def __init__(
+        self,
+        throughput_mode: bool = False,
+        process_workers: int = 0,
+        large_text_file_mb: float = LARGE_TEXT_FILE_MB,
+        large_text_sample_chars: int = LARGE_TEXT_SAMPLE_CHARS,
+    ):
+        """
+        Initialize document processor.
+
+        Args:
+            throughput_mode: Use Docling's fast table-structure model instead of
+                the accurate one, trading table fidelity for conversion speed
+            process_workers: When above 1, multi-file Docling batches are split
+                across a persistent pool of this many worker processes instead
+                of one in-process convert_all() (useful for CPU-only OCR/table
+                inference; call close() to shut the pool down)
+            large_text_file_mb: Text files above this size (MB) are sampled
+                instead of read in full
+            large_text_sample_chars: Characters kept from the head of a sampled file
+        """
+        self.logger = logging.getLogger(__name__)
+        self.throughput_mode = throughput_mode
+        self.process_workers = process_workers
+        self.large_text_file_mb = large_text_file_mb
+        self.large_text_sample_chars = large_text_sample_chars
+
+        # Docling converter is created on first use (see the converter property),
+        # so a processor that never parses a document doesn't pay for it
+        self._converter = None
+        self._converter_initialized = False
+        self._converter_lock = threading.Lock()
+
+        # Docling worker pool, started on the first multi-process batch and
+        # kept so each worker loads its converter once for the processor's life
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
 
         # Fallback LangChain tools
         self.text_splitter = RecursiveCharacterTextSplitter(
@@ -111,9 +266,36 @@ class DocumentProcessor:
             length_function=len,
         )
 
+        # Guards document storage and stats when files are processed in parallel
+        self._lock = threading.Lock()
+
         # Document storage
         self.processed_documents: List[ProcessedDocument] = []
         self.document_context: Dict[str, str] = {}  # filename -> content mapping
+        self._content_hashes: Dict[bytes, str] = {}  # content hash -> filename in context
+        self._context_chars = 0  # total length of document_context values
+
+        # Running totals over processed_documents for get_statistics()
+        self._total_processing_time = 0.0
+        self._file_types: Dict[str, None] = {}  # dict keys keep first-seen order
+
+        # Search index: lowercased content per document and word -> documents
+        # containing it, maintained as documents enter the context
+        self._lower_cache: Dict[str, str] = {}
+        self._token_index: Dict[str, set] = {}
+
+        # Parsed documents keyed by (path, mtime_ns, size), so unchanged files
+        # aren't parsed again
+        self._document_cache = CacheManager(maxsize=self.DOCUMENT_CACHE_SIZE)
+
+        # get_combined_context() results keyed by (context version, max_chars)
+        self._context_version = 0
+        self._combined_context_cache = CacheManager(maxsize=4)
+
+        # One psutil handle for the process (cpu_percent() measures since its
+        # previous call on the same handle) and a short-lived stats cache
+        self._process = psutil.Process()
+        self._system_stats_cache = CacheManager(maxsize=1, ttl=self.SYSTEM_STATS_TTL_SECONDS)
 
         # Statistics
         self.stats = {
@@ -125,6 +307,29 @@ class DocumentProcessor:
 
         self.logger.info(f"Document Processor initialized (Docling: {DOCLING_AVAILABLE})")
 
+    @property
+    def converter(self):
+        """Docling converter, initialized on first access (None if unavailable)"""
+        if not self._converter_initialized:
+            with self._converter_lock:
+                if not self._converter_initialized:
+                    self._converter = self._create_converter()
+                    self._converter_initialized = True
+        return self._converter
+
+    def _create_converter(self):
+        """Create the Docling converter, or return None to use the fallback"""
+        if not DOCLING_AVAILABLE:
+            return None
+
+        try:
+            converter = _build_converter(self.throughput_mode)
+            self.logger.info("Docling converter initialized successfully")
+            return converter
+        except Exception as e:
+            self.logger.warning(f"Failed to initialize Docling: {e}. Using fallback.")
+            return None
+
     def process_file(self, file_path: str) -> ProcessedDocument:
         """
         Process a single file and extract content.
@@ -139,7 +344,8 @@ class DocumentProcessor:
         file_path_obj = Path(file_path)
 
         try:
-            if not file_path_obj.exists():
+            st = self._stat_or_none(file_path_obj)
+            if st is None:
                 return ProcessedDocument(
                     file_path=file_path,
                     file_name=file_path_obj.name,
@@ -150,18 +356,28 @@ class DocumentProcessor:
                     processing_time=0
                 )
 
+            cache_key = self._document_cache_key(file_path_obj, st)
+            cached = self._from_cache(cache_key)
+            if cached is not None:
+                return cached
+
             # Try Docling first
-            if self.converter and DOCLING_AVAILABLE:
-                return self._process_with_docling(file_path_obj, start_time)
+            if DOCLING_AVAILABLE and self.converter:
+                doc = self._process_with_docling(file_path_obj, start_time)
             else:
-                return self._process_with_fallback(file_path_obj, start_time)
+                doc = self._process_with_fallback(file_path_obj, start_time)
+
+            if doc.success:
+                self._document_cache.put(cache_key, doc)
+            return doc
 
         except Exception as e:
             self.logger.error(f"Error processing {file_path}: {str(e)}")
             processing_time = (datetime.now() - start_time).total_seconds()
 
-            self.stats["total_processed"] += 1
-            self.stats["failed"] += 1
+            with self._lock:
+                self.stats["total_processed"] += 1
+                self.stats["failed"] += 1
 
             return ProcessedDocument(
                 file_path=str(file_path_obj.absolute()),
@@ -173,79 +389,238 @@ class DocumentProcessor:
                 processing_time=processing_time
             )
 
+    @staticmethod
+    def _stat_or_none(file_path: Path) -> Optional[os.stat_result]:
+        """Stat a file, or return None if it can't be reached (like Path.exists())"""
+        try:
+            return file_path.stat()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _document_cache_key(file_path: Path, st: os.stat_result) -> tuple:
+        """Cache key that changes whenever the file is modified"""
+        return (str(file_path.absolute()), st.st_mtime_ns, st.st_size)
+
+    def _from_cache(self, cache_key: tuple) -> Optional[ProcessedDocument]:
+        """
+        Reuse the parsed document for an unchanged file, if cached.
+
+        The document is added to context and counted as processed, as if it
+        had just been parsed.
+
+        Args:
+            cache_key: Key from _document_cache_key()
+
+        Returns:
+            Cached ProcessedDocument, or None on a miss
+        """
+        doc = self._document_cache.get(cache_key)
+        if doc is None:
+            return None
+
+        self._add_to_context(doc)
+        with self._lock:
+            self.stats["total_processed"] += 1
+            self.stats["successful"] += 1
+            self.stats["total_size_mb"] += doc.metadata.get("file_size_mb", 0)
+
+        self.logger.info(f"Reused cached parse of {doc.file_name}")
+        return doc
+
     def _process_with_docling(self, file_path: Path, start_time: datetime) -> ProcessedDocument:
         """Process file using Docling"""
         try:
             result = self.converter.convert(str(file_path))
+            return self._finalize_docling_result(result, file_path, start_time)
+
+        except Exception as e:
+            self.logger.warning(f"Docling failed for {file_path.name}, trying fallback: {e}")
+            return self._process_with_fallback(file_path, start_time)
+
+    def _process_batch_with_docling(self, file_paths: List[Path]) -> List[ProcessedDocument]:
+        """
+        Convert several files in one Docling convert_all() call.
+
+        Docling pipelines page and document batches internally, so one call
+        over all files overlaps model inference that per-file convert() calls
+        would run back to back. Files Docling does not convert successfully go
+        through the fallback processor.
+
+        Args:
+            file_paths: Existing files to process
+
+        Returns:
+            ProcessedDocument for each file, in input order
+        """
+        concurrency = max(1, min(len(file_paths), os.cpu_count() or 1))
+        batch_perf = {
+            "doc_batch_size": len(file_paths),
+            "doc_batch_concurrency": concurrency,
+            "page_batch_concurrency": concurrency,
+        }
 
-            # Extract content
-            content = result.document.export_to_markdown()
+        positions = {str(fp): i for i, fp in enumerate(file_paths)}
+        docs: List[Optional[ProcessedDocument]] = [None] * len(file_paths)
+        start_time = datetime.now()
 
-            # Extract tables if present
-            tables = []
-            if hasattr(result.document, 'tables') and result.document.tables:
-                for i, table in enumerate(result.document.tables):
+        with _DOCLING_PERF_LOCK:
+            saved_perf = {name: getattr(docling_settings.perf, name) for name in batch_perf}
+            try:
+                for name, value in batch_perf.items():
+                    setattr(docling_settings.perf, name, value)
+                results = self.converter.convert_all([str(fp) for fp in file_paths], raises_on_error=False)
+                for result in results:
+                    i = positions.get(str(result.input.file))
+                    if i is None:
+                        continue
+                    file_path = file_paths[i]
                     try:
-                        tables.append({
-                            "id": i,
-                            "markdown": str(table),
-                            "row_count": getattr(table, 'row_count', 0)
-                        })
+                        if result.status == ConversionStatus.SUCCESS:
+                            docs[i] = self._finalize_docling_result(result, file_path, start_time)
+                        else:
+                            self.logger.warning(f"Docling could not convert {file_path.name} ({result.status}), trying fallback")
+                            docs[i] = self._process_with_fallback(file_path, start_time)
                     except Exception as e:
-                        self.logger.warning(f"Error extracting table {i}: {e}")
+                        self.logger.warning(f"Docling failed for {file_path.name}, trying fallback: {e}")
+                        docs[i] = self._process_with_fallback(file_path, start_time)
+                    # Results stream in, so each document's time runs from the previous one
+                    start_time = datetime.now()
+            except Exception as e:
+                self.logger.warning(f"Docling batch conversion failed, processing remaining files one by one: {e}")
+            finally:
+                # Restore the caller's settings so single-file converts aren't affected
+                for name, value in saved_perf.items():
+                    setattr(docling_settings.perf, name, value)
+
+        return [
+            doc if doc is not None else self.process_file(str(fp))
+            for doc, fp in zip(docs, file_paths)
+        ]
+
+    def _process_batch_in_processes(self, file_paths: List[Path]) -> List[ProcessedDocument]:
+        """
+        Convert several files across a pool of Docling worker processes.
 
-            # Extract metadata
-            file_size = file_path.stat().st_size
-            metadata = {
-                "page_count": getattr(result.document, 'page_count', 0),
-                "language": getattr(result.document, 'language', 'unknown'),
-                "file_size": file_size,
-                "file_size_mb": round(file_size / (1024 * 1024), 2),
-                "created": datetime.fromtimestamp(file_path.stat().st_ctime).isoformat(),
-                "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
-                "processor": "docling"
-            }
+        Docling inference is mostly GIL-bound in one process, so separate
+        processes scale across cores. The pool outlives the call, so each
+        worker builds its converter once and later batches skip that start-up.
+        Files a worker fails to convert go through the fallback processor.
 
-            processing_time = (datetime.now() - start_time).total_seconds()
+        Args:
+            file_paths: Existing files to process
 
-            doc = ProcessedDocument(
-                file_path=str(file_path.absolute()),
-                file_name=file_path.name,
-                file_type=file_path.suffix,
-                content=content,
-                metadata=metadata,
-                tables=tables,
-                success=True,
-                processing_time=processing_time
-            )
+        Returns:
+            ProcessedDocument for each file, in input order
+        """
+        docs = []
+        start_time = datetime.now()
+        tasks = [(str(fp), self.throughput_mode) for fp in file_paths]
 
-            # Add to context
-            self.processed_documents.append(doc)
-            self.document_context[file_path.name] = content
+        try:
+            pool = self._get_process_pool()
+            for file_path, (_, extracted, error) in zip(file_paths, pool.map(_worker_convert, tasks, chunksize=1)):
+                if extracted is not None:
+                    docs.append(self._build_docling_document(file_path, extracted, start_time))
+                else:
+                    self.logger.warning(f"Docling worker failed for {file_path.name}, trying fallback: {error}")
+                    docs.append(self._process_with_fallback(file_path, start_time))
+                # Results stream in, so each document's time runs from the previous one
+                start_time = datetime.now()
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                # A worker died; start a fresh pool on the next batch
+                self._shutdown_process_pool(wait=False)
+            self.logger.warning(f"Docling process pool failed, converting remaining files in-process: {e}")
+            docs.extend(self._process_batch_with_docling(file_paths[len(docs):]))
+
+        return docs
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the Docling worker pool, starting it on first use"""
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                # spawn: forking a process that may hold torch/OpenMP threads is unsafe
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._process_pool
+
+    def _shutdown_process_pool(self, wait: bool = True) -> None:
+        """Shut the worker pool down (a later batch starts a new one)"""
+        with self._process_pool_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def close(self) -> None:
+        """Release the Docling worker processes, if any were started"""
+        self._shutdown_process_pool()
+
+    def _finalize_docling_result(self, result, file_path: Path, start_time: datetime) -> ProcessedDocument:
+        """Build, store and count the ProcessedDocument for a Docling result"""
+        return self._build_docling_document(file_path, _extract_docling_result(result), start_time)
+
+    def _build_docling_document(self, file_path: Path, extracted: Dict[str, Any], start_time: datetime) -> ProcessedDocument:
+        """Build, store and count the ProcessedDocument for extracted Docling output"""
+        # Extract metadata (one stat call for size and times)
+        st = file_path.stat()
+        metadata = {
+            "page_count": extracted["page_count"],
+            "language": extracted["language"],
+            "file_size": st.st_size,
+            "file_size_mb": round(st.st_size / (1024 * 1024), 2),
+            "created": datetime.fromtimestamp(st.st_ctime).isoformat(),
+            "modified": datetime.fromtimestamp(st.st_mtime).isoformat(),
+            "processor": "docling"
+        }
 
-            # Update stats
+        processing_time = (datetime.now() - start_time).total_seconds()
+
+        doc = ProcessedDocument(
+            file_path=str(file_path.absolute()),
+            file_name=file_path.name,
+            file_type=file_path.suffix,
+            content=extracted["content"],
+            metadata=metadata,
+            tables=extracted["tables"],
+            success=True,
+            processing_time=processing_time
+        )
+
+        # Add to context
+        self._add_to_context(doc)
+
+        # Update stats
+        with self._lock:
             self.stats["total_processed"] += 1
             self.stats["successful"] += 1
             self.stats["total_size_mb"] += metadata["file_size_mb"]
 
-            self.logger.info(f"Docling processed {file_path.name} in {processing_time:.2f}s")
+        self.logger.info(f"Docling processed {file_path.name} in {processing_time:.2f}s")
 
-            return doc
-
-        except Exception as e:
-            self.logger.warning(f"Docling failed for {file_path.name}, trying fallback: {e}")
-            return self._process_with_fallback(file_path, start_time)
+        return doc
 
     def _process_with_fallback(self, file_path: Path, start_time: datetime) -> ProcessedDocument:
         """Fallback processing using LangChain and simple text extraction"""
+        absolute_path = str(file_path.absolute())
         try:
-            file_size = file_path.stat().st_size
+            st = file_path.stat()
+            file_size = st.st_size
             file_size_mb = file_size / (1024 * 1024)
 
+            sampled = False
+
             # Try text files directly
             if file_path.suffix in ['.txt', '.md', '.csv', '.json']:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
+                with open(file_path, 'r', encoding='utf-8', errors='ignore', buffering=1024 * 1024) as f:
+                    if file_size_mb > self.large_text_file_mb:
+                        # Too big for agent context: keep the head only, never load the rest
+                        content = f.read(self.large_text_sample_chars)
+                        sampled = True
+                    else:
+                        content = f.read()
             else:
                 # Try UnstructuredFileLoader
                 try:
@@ -264,15 +639,25 @@ class DocumentProcessor:
             metadata = {
                 "file_size": file_size,
                 "file_size_mb": round(file_size_mb, 2),
-                "created": datetime.fromtimestamp(file_path.stat().st_ctime).isoformat(),
-                "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
+                "created": datetime.fromtimestamp(st.st_ctime).isoformat(),
+                "modified": datetime.fromtimestamp(st.st_mtime).isoformat(),
                 "processor": "fallback"
             }
+            if sampled:
+                metadata["sampled_chars"] = len(content)
+                self.logger.warning(
+                    f"{file_path.name} is {file_size_mb:.1f} MB; only its first "
+                    f"{len(content):,} characters were loaded"
+                )
+                content += (
+                    f"\n\n[Truncated: showing the first {len(content):,} characters "
+                    f"of {file_path.name} ({file_size_mb:.1f} MB)]"
+                )
 
             processing_time = (datetime.now() - start_time).total_seconds()
 
             doc = ProcessedDocument(
-                file_path=str(file_path.absolute()),
+                file_path=absolute_path,
                 file_name=file_path.name,
                 file_type=file_path.suffix,
                 content=content,
@@ -282,13 +667,13 @@ class DocumentProcessor:
             )
 
             # Add to context
-            self.processed_documents.append(doc)
-            self.document_context[file_path.name] = content
+            self._add_to_context(doc)
 
             # Update stats
-            self.stats["total_processed"] += 1
-            self.stats["successful"] += 1
-            self.stats["total_size_mb"] += file_size_mb
+            with self._lock:
+                self.stats["total_processed"] += 1
+                self.stats["successful"] += 1
+                self.stats["total_size_mb"] += file_size_mb
 
             self.logger.info(f"Fallback processed {file_path.name} in {processing_time:.2f}s")
 
@@ -297,11 +682,12 @@ class DocumentProcessor:
         except Exception as e:
             processing_time = (datetime.now() - start_time).total_seconds()
 
-            self.stats["total_processed"] += 1
-            self.stats["failed"] += 1
+            with self._lock:
+                self.stats["total_processed"] += 1
+                self.stats["failed"] += 1
 
             return ProcessedDocument(
-                file_path=str(file_path.absolute()),
+                file_path=absolute_path,
                 file_name=file_path.name,
                 file_type=file_path.suffix,
                 content="",
@@ -310,6 +696,51 @@ class DocumentProcessor:
                 processing_time=processing_time
             )
 
+    def _add_to_context(self, doc: ProcessedDocument):
+        """
+        Store a processed document and add its content to the agent context.
+
+        Content identical to a document already in context under another
+        name is not added again, so duplicates don't inflate agent prompts.
+
+        Args:
+            doc: Successfully processed document
+        """
+        content_hash = hashlib.blake2b(doc.content.encode("utf-8", "ignore"), digest_size=16).digest()
+
+        with self._lock:
+            self.processed_documents.append(doc)
+            self._total_processing_time += doc.processing_time
+            self._file_types[doc.file_type] = None
+
+            existing = self._content_hashes.get(content_hash)
+            if (existing is not None and existing != doc.file_name
+                    and self.document_context.get(existing) == doc.content):
+                self.logger.info(f"{doc.file_name} duplicates {existing}; not added to context again")
+                return
+
+            self._content_hashes[content_hash] = doc.file_name
+            self._context_chars += len(doc.content) - len(self.document_context.get(doc.file_name, ""))
+            self.document_context[doc.file_name] = doc.content
+            self._index_document(doc.file_name, doc.content)
+            self._context_version += 1
+
+    def _index_document(self, name: str, content: str):
+        """Add a document to the search index, replacing an older version (caller holds the lock)"""
+        old_lowered = self._lower_cache.get(name)
+        if old_lowered is not None:
+            for token in set(_WORD_RE.findall(old_lowered)):
+                names = self._token_index.get(token)
+                if names is not None:
+                    names.discard(name)
+                    if not names:
+                        del self._token_index[token]
+
+        lowered = content.lower()
+        self._lower_cache[name] = lowered
+        for token in set(_WORD_RE.findall(lowered)):
+            self._token_index.setdefault(token, set()).add(name)
+
     def process_documents(self, file_paths: List[str]) -> List[ProcessingResult]:
         """
         Process multiple files (legacy interface for backward compatibility).
@@ -320,32 +751,61 @@ class DocumentProcessor:
         Returns:
             List of ProcessingResult objects
         """
-        results = []
-        for file_path in file_paths:
-            doc = self.process_file(file_path)
-
-            # Convert to legacy format
-            result = ProcessingResult(
+        # Convert to legacy format
+        return [
+            ProcessingResult(
                 success=doc.success,
                 document_text=doc.content,
                 document_metadata=doc.metadata,
                 error=doc.error or ""
             )
-            results.append(result)
+            for doc in self.process_multiple_files(file_paths)
+        ]
 
-        return results
-
-    def process_multiple_files(self, file_paths: List[str]) -> List[ProcessedDocument]:
+    def process_multiple_files(self, file_paths: List[str], max_workers: int = CPU_COUNT) -> List[ProcessedDocument]:
         """
         Process multiple files (new interface).
 
         Args:
             file_paths: List of file paths
+            max_workers: Threads used for files Docling doesn't batch (1 processes serially)
 
         Returns:
-            List of ProcessedDocument objects
+            List of ProcessedDocument objects, in input order
         """
-        return [self.process_file(fp) for fp in file_paths]
+        file_stats = [self._stat_or_none(Path(fp)) for fp in file_paths]
+        if sum(st is not None for st in file_stats) < 2 or not (DOCLING_AVAILABLE and self.converter):
+            # Fallback loading is mostly file I/O and loader subprocesses, which
+            # release the GIL, so threads overlap it
+            workers = max(1, min(len(file_paths), max_workers))
+            if workers == 1:
+                return [self.process_file(fp) for fp in file_paths]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(self.process_file, file_paths))
+
+        # Convert every existing, uncached file in one Docling batch; missing
+        # files get the usual not-found result from process_file()
+        docs: List[Optional[ProcessedDocument]] = [None] * len(file_paths)
+        pending = []
+        for i, (fp, st) in enumerate(zip(file_paths, file_stats)):
+            if st is not None:
+                cache_key = self._document_cache_key(Path(fp), st)
+                docs[i] = self._from_cache(cache_key)
+                if docs[i] is None:
+                    pending.append((i, cache_key))
+
+        if pending:
+            pending_paths = [Path(file_paths[i]) for i, _ in pending]
+            if self.process_workers > 1 and len(pending) > 1:
+                batch = self._process_batch_in_processes(pending_paths)
+            else:
+                batch = self._process_batch_with_docling(pending_paths)
+            for (i, cache_key), doc in zip(pending, batch):
+                docs[i] = doc
+                if doc.success:
+                    self._document_cache.put(cache_key, doc)
+
+        return [doc if doc is not None else self.process_file(fp) for doc, fp in zip(docs, file_paths)]
 
     def get_document_context(self) -> Dict[str, str]:
         """
@@ -369,14 +829,30 @@ class DocumentProcessor:
         if not self.document_context:
             return ""
 
-        combined = "\n\n--- DOCUMENT CONTEXT ---\n\n".join([
-            f"📄 {name}\n{content}"
-            for name, content in self.document_context.items()
-        ])
-
-        if len(combined) > max_chars:
-            combined = combined[:max_chars] + f"\n\n[Truncated... {len(self.document_context)} documents total, {len(combined)} chars]"
-
+        cache_key = (self._context_version, max_chars)
+        combined = self._combined_context_cache.get(cache_key)
+        if combined is not None:
+            return combined
+
+        # Copy only the first max_chars of the joined text instead of joining
+        # everything and slicing
+        separator = "\n\n--- DOCUMENT CONTEXT ---\n\n"
+        parts = []
+        remaining = max_chars
+        total_len = self._context_chars + len(separator) * (len(self.document_context) - 1)
+        for i, (name, content) in enumerate(self.document_context.items()):
+            header = f"📄 {name}\n"
+            total_len += len(header)
+            for piece in ((separator, header, content) if i else (header, content)):
+                if remaining > 0:
+                    parts.append(piece[:remaining])
+                    remaining -= len(piece)
+
+        combined = "".join(parts)
+        if total_len > max_chars:
+            combined += f"\n\n[Truncated... {len(self.document_context)} documents total, {total_len} chars]"
+
+        self._combined_context_cache.put(cache_key, combined)
         return combined
 
     def search_documents(self, query: str) -> List[Dict[str, Any]]:
@@ -392,10 +868,24 @@ class DocumentProcessor:
         results = []
         query_lower = query.lower()
 
+        # Words with a separator on both sides in the query must appear as
+        # whole words in any matching document, so the index narrows the
+        # candidates. The first and last words may be parts of longer words,
+        # so they can't be used.
+        candidates = None
+        for match in _WORD_RE.finditer(query_lower):
+            if match.start() > 0 and match.end() < len(query_lower):
+                names = self._token_index.get(match.group(), set())
+                candidates = names if candidates is None else candidates & names
+
         for name, content in self.document_context.items():
-            if query_lower in content.lower():
+            if candidates is not None and name not in candidates:
+                continue
+
+            lowered = self._lower_cache[name]
+            idx = lowered.find(query_lower)
+            if idx != -1:
                 # Find context around match
-                idx = content.lower().find(query_lower)
                 start = max(0, idx - 100)
                 end = min(len(content), idx + 100)
                 excerpt = "..." + content[start:end] + "..."
@@ -403,7 +893,7 @@ class DocumentProcessor:
                 results.append({
                     "filename": name,
                     "excerpt": excerpt,
-                    "relevance": content.lower().count(query_lower)
+                    "relevance": lowered.count(query_lower)
                 })
 
         # Sort by relevance
@@ -412,16 +902,20 @@ class DocumentProcessor:
         return results
 
     def get_system_stats(self) -> Dict[str, Any]:
-        """Get processing and system statistics"""
+        """Get processing and system statistics (cached for SYSTEM_STATS_TTL_SECONDS)"""
+        cached = self._system_stats_cache.get("system")
+        if cached is not None:
+            return cached
+
         try:
-            process = psutil.Process()
+            process = self._process
             memory_info = process.memory_info()
 
-            return {
+            system_stats = {
                 "processing_stats": self.stats,
                 "document_stats": {
                     "documents_in_context": len(self.document_context),
-                    "total_context_size": sum(len(c) for c in self.document_context.values())
+                    "total_context_size": self._context_chars
                 },
                 "system_info": {
                     "current_memory_mb": round(memory_info.rss / 1024 / 1024, 2),
@@ -429,6 +923,8 @@ class DocumentProcessor:
                     "num_threads": process.num_threads()
                 }
             }
+            self._system_stats_cache.put("system", system_stats)
+            return system_stats
         except Exception as e:
             self.logger.error(f"Error getting system stats: {str(e)}")
             return {
@@ -443,16 +939,23 @@ class DocumentProcessor:
             **self.stats,
             "documents_in_context": len(self.document_context),
             "average_processing_time": round(
-                sum(doc.processing_time for doc in self.processed_documents) /
-                len(self.processed_documents), 2
+                self._total_processing_time / len(self.processed_documents), 2
             ) if self.processed_documents else 0,
-            "file_types": list(set(doc.file_type for doc in self.processed_documents))
+            "file_types": list(self._file_types)
         }
 
     def clear_context(self):
         """Clear all processed documents and context"""
-        self.processed_documents.clear()
-        self.document_context.clear()
+        with self._lock:
+            self.processed_documents.clear()
+            self._total_processing_time = 0.0
+            self._file_types.clear()
+            self.document_context.clear()
+            self._content_hashes.clear()
+            self._context_chars = 0
+            self._lower_cache.clear()
+            self._token_index.clear()
+            self._context_version += 1
         self.logger.info("Document context cleared")
 
     def export_context(self, output_path: str):
@@ -462,13 +965,37 @@ class DocumentProcessor:
         Args:
             output_path: Path to output JSON file
         """
-        export_data = {
-            "documents": [doc.dict() for doc in self.processed_documents],
-            "statistics": self.get_statistics(),
-            "timestamp": datetime.now().isoformat()
-        }
+        if ORJSON_AVAILABLE:
+            dumps = orjson.dumps
+        else:
+            def dumps(obj):
+                return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        with self._lock:
+            documents = list(self.processed_documents)
+
+        # Write to a temp file in the same directory and swap it in, so readers
+        # never see a partially written export. Documents are encoded one at a
+        # time rather than building the whole payload in memory first.
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+        try:
+            # mkstemp creates the file 0600; give it the mode a plain open() would have
+            os.chmod(tmp_path, _export_file_mode(output_path))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(b'{"documents":[')
+                for i, doc in enumerate(documents):
+                    if i:
+                        f.write(b',')
+                    f.write(dumps(doc.model_dump()))
+                f.write(b'],"statistics":')
+                f.write(dumps(self.get_statistics()))
+                f.write(b',"timestamp":')
+                f.write(dumps(datetime.now().isoformat()))
+                f.write(b'}')
+            os.replace(tmp_path, output_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
 
         self.logger.info(f"Context exported to {output_path}")
@@ -1,13 +1,16 @@
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Deque
+from collections import Counter, deque
+from dataclasses import dataclass, field
 import logging
 
-@dataclass
+@dataclass(slots=True)
 class ConversationState:
     active_speakers: List[str]
-    pending_responses: List[str]
+    pending_responses: Deque[str]
     context: Dict
     stage: str
+    # Turns per speaker, kept in step with active_speakers
+    speaker_counts: Counter = field(default_factory=Counter)
 
 class GroupOrchestrator:
     def __init__(self):
@@ -19,7 +22,7 @@ class GroupOrchestrator:
         conv_id = f"group_{len(self.conversations)}"
         self.conversations[conv_id] = ConversationState(
             active_speakers=[],
-            pending_responses=participants.copy(),
+            pending_responses=deque(participants),
             context=initial_context,
             stage="initial"
         )
@@ -27,10 +30,9 @@ class GroupOrchestrator:
         
     def determine_next_speaker(self, conv_id: str) -> Optional[str]:
         """Determine who should speak next based on conversation state."""
-        if conv_id not in self.conversations:
+        state = self.conversations.get(conv_id)
+        if state is None:
             return None
-            
-        state = self.conversations[conv_id]
         
         # Implement speaker selection logic based on:
         # 1. Current conversation stage
@@ -39,18 +41,18 @@ class GroupOrchestrator:
         # 4. Expertise relevance
         
         if state.pending_responses:
-            next_speaker = state.pending_responses.pop(0)
+            next_speaker = state.pending_responses.popleft()
             state.active_speakers.append(next_speaker)
+            state.speaker_counts[next_speaker] += 1
             return next_speaker
             
         return None
         
     def update_conversation_stage(self, conv_id: str, message: Dict) -> None:
         """Update conversation stage based on message content."""
-        if conv_id not in self.conversations:
+        state = self.conversations.get(conv_id)
+        if state is None:
             return
-            
-        state = self.conversations[conv_id]
         
         # Implement stage transition logic based on:
         # 1. Message content analysis
@@ -64,10 +66,9 @@ class GroupOrchestrator:
             
     def validate_group_progress(self, conv_id: str) -> Dict:
         """Validate group discussion progress and quality."""
-        if conv_id not in self.conversations:
+        state = self.conversations.get(conv_id)
+        if state is None:
             return {'valid': False, 'reason': 'Conversation not found'}
-            
-        state = self.conversations[conv_id]
         
         # Implement validation checks:
         # 1. Balanced participation
@@ -85,15 +86,12 @@ class GroupOrchestrator:
         
     def _calculate_participation_balance(self, state: ConversationState) -> float:
         """Calculate how balanced the participation is among group members."""
-        if not state.active_speakers:
+        speaker_counts = state.speaker_counts
+        if not speaker_counts:
             return 0.0
             
-        speaker_counts = {}
-        for speaker in state.active_speakers:
-            speaker_counts[speaker] = speaker_counts.get(speaker, 0) + 1
-            
-        # Calculate participation balance score
-        total_messages = len(state.active_speakers)
+        # Calculate participation balance score (O(unique speakers))
+        total_messages = speaker_counts.total()
         expected_count = total_messages / len(speaker_counts)
         
         deviation_sum = sum(abs(count - expected_count) for count in speaker_counts.values())
@@ -5,23 +5,180 @@ This agent specializes in inventory analysis, stock level optimization,
 and demand forecasting using OpenAI function calling.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from agents.base_agent import BaseAgent, AgentConfig
+from openai import AsyncOpenAI
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
 import math
+import numpy as np
+from scipy.stats import norm
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Run the kernel as plain Python when numba is not installed"""
+        return lambda func: func
+
+
+@njit(cache=True)
+def _holt_kernel(demand: np.ndarray, alpha: float, beta: float, phi: float) -> Tuple[float, float]:
+    """Final Holt level and trend after smoothing the whole series (phi damps the trend)"""
+    level = demand[0]
+    trend = demand[1] - demand[0]
+    for i in range(1, demand.shape[0]):
+        previous_level = level
+        level = alpha * demand[i] + (1 - alpha) * (level + phi * trend)
+        trend = beta * (level - previous_level) + (1 - beta) * phi * trend
+    return level, trend
+
+
+@lru_cache(maxsize=2048)
+def _eoq_core(annual_demand: float, order_cost: float, holding_cost: float) -> Tuple[float, float, float, float]:
+    """EOQ, orders per year, days between orders and total annual cost"""
+    # EOQ = sqrt((2 * D * S) / H)
+    # D = annual demand, S = order cost, H = holding cost
+    two_ds = 2 * annual_demand * order_cost
+    eoq = math.sqrt(two_ds / holding_cost)
+    orders_per_year = annual_demand / eoq
+    # At the EOQ, ordering cost D/Q*S and holding cost Q/2*H are equal and sum to sqrt(2DSH)
+    total_cost = math.sqrt(two_ds * holding_cost)
+    return eoq, orders_per_year, 365 / orders_per_year, total_cost
+
+
+@lru_cache(maxsize=2048)
+def _z_score(service_level: float) -> float:
+    """Standard normal inverse CDF, rounded to 3 decimals"""
+    return round(float(norm.ppf(service_level)), 3)
+
+
+@lru_cache(maxsize=2048)
+def _turnover_core(cost_of_goods_sold: float, average_inventory_value: float) -> Tuple[float, float]:
+    """Turnover rate and days in inventory"""
+    # Inventory Turnover = COGS / Average Inventory
+    turnover_rate = cost_of_goods_sold / average_inventory_value
+    return turnover_rate, 365 / turnover_rate
+
+
+# Turnover bands: a rate above TURNOVER_BOUNDS[i] falls in band i + 1
+_TURNOVER_BOUNDS = (4, 8, 12)
+_TURNOVER_PERFORMANCE = (
+    "Low - Potential overstocking issues",
+    "Moderate - Room for improvement",
+    "Good - Healthy turnover rate",
+    "Excellent - Very fast moving inventory"
+)
+_TURNOVER_RECOMMENDATIONS = (
+    "Urgent: Review inventory levels. Implement discounting for slow movers and reduce new orders.",
+    "Review slow-moving items. Consider promotions or reduced order quantities.",
+    "Good balance. Consider incremental improvements in forecasting.",
+    "Continue current practices. Monitor for potential stockouts."
+)
+
+
+# Decimal places per result key when formatting (None leaves the value as given)
+_RESULT_PRECISION = {
+    "z_score": 3,
+    "expected_stockout_probability": 4,
+    "service_level": None,
+    "alpha": None,
+    "beta": None,
+    "phi": None
+}
+
+
+def _fmt(obj: Any, ndigits: Optional[int] = 2) -> Any:
+    """
+    Round every float in a tool result once, just before it is returned to the model.
 
+    Args:
+        obj: Result value (dicts and lists are walked, ndarrays become lists)
+        ndigits: Decimal places, overridden per key by _RESULT_PRECISION
 
-class InventoryAgent(BaseAgent):
-    """
-    Inventory management agent with specialized tools for:
-    - Stock level analysis
-    - EOQ (Economic Order Quantity) calculation
-    - Reorder point determination
-    - Safety stock calculation
-    - Demand forecasting
+    Returns:
+        Result with floats rounded
     """
+    if isinstance(obj, dict):
+        return {key: _fmt(value, _RESULT_PRECISION.get(key, ndigits)) for key, value in obj.items()}
+    if ndigits is None:
+        return obj.tolist() if isinstance(obj, np.ndarray) else obj
+    if isinstance(obj, float):
+        return round(float(obj), ndigits)
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "f":
+            # Widen first so float32 results round to clean decimals
+            obj = np.round(obj.astype(np.float64, copy=False), ndigits)
+        return obj.tolist()
+    if isinstance(obj, list):
+        return [_fmt(value, ndigits) for value in obj]
+    return obj
+
+
+@dataclass(slots=True)
+class InventorySnapshot:
+    """Column-oriented (one float64 array per field) inventory data for many SKUs"""
+    sku_ids: List[str]
+    annual_demand: np.ndarray
+    order_cost: np.ndarray
+    holding_cost: np.ndarray
+    lead_time_days: np.ndarray
+    demand_std_dev: np.ndarray
+
+    COLUMNS = ("annual_demand", "order_cost", "holding_cost", "lead_time_days", "demand_std_dev")
+
+    def __post_init__(self):
+        for name in self.COLUMNS:
+            column = np.ascontiguousarray(getattr(self, name), dtype=np.float64)
+            if column.shape != (len(self.sku_ids),):
+                raise ValueError(f"{name} must have one value per SKU ({len(self.sku_ids)})")
+            setattr(self, name, column)
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> "InventorySnapshot":
+        """
+        Build a snapshot from per-SKU dictionaries.
 
-    def _get_system_prompt(self) -> str:
-        return """You are an expert inventory management agent for a warehouse system.
+        Args:
+            records: Dicts with sku_id plus every field in COLUMNS
+
+        Returns:
+            InventorySnapshot with each column allocated once
+        """
+        n = len(records)
+        columns = {
+            name: np.fromiter((record[name] for record in records), dtype=np.float64, count=n)
+            for name in cls.COLUMNS
+        }
+        return cls(sku_ids=[str(record["sku_id"]) for record in records], **columns)
+
+    def __len__(self) -> int:
+        return len(self.sku_ids)
+
+
+def _plan_snapshot(snapshot: InventorySnapshot, service_level: float) -> Dict[str, np.ndarray]:
+    """EOQ, safety stock and reorder point for every SKU in one vectorized pass"""
+    two_ds = 2 * snapshot.annual_demand * snapshot.order_cost
+    eoq = np.sqrt(two_ds / snapshot.holding_cost)
+    total_cost = np.sqrt(two_ds * snapshot.holding_cost)
+    daily_demand = snapshot.annual_demand / 365
+    safety_stock = _z_score(service_level) * snapshot.demand_std_dev * np.sqrt(snapshot.lead_time_days)
+    reorder_point = daily_demand * snapshot.lead_time_days + safety_stock
+
+    return {
+        "eoq": eoq,
+        "total_annual_cost": total_cost,
+        "daily_demand": daily_demand,
+        "safety_stock": safety_stock,
+        "reorder_point": reorder_point
+    }
+
+
+_SYSTEM_PROMPT = """You are an expert inventory management agent for a warehouse system.
 
 Your responsibilities include:
 - Analyzing stock levels and identifying potential stockouts or overstocking
@@ -41,347 +198,648 @@ When analyzing inventory data:
 Use the provided functions to perform calculations. Always provide clear, actionable recommendations with supporting data.
 """
 
-    def _get_tools(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "calculate_eoq",
-                    "description": "Calculate Economic Order Quantity - the optimal order quantity that minimizes total inventory costs",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "annual_demand": {
-                                "type": "number",
-                                "description": "Annual demand in units"
-                            },
-                            "order_cost": {
-                                "type": "number",
-                                "description": "Cost per order (fixed cost)"
-                            },
-                            "holding_cost": {
-                                "type": "number",
-                                "description": "Annual holding cost per unit"
-                            }
-                        },
-                        "required": ["annual_demand", "order_cost", "holding_cost"]
+
+# Tool definitions are static, so they are built once at import and shared by every instance
+_TOOLS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "calculate_eoq",
+            "description": "Calculate Economic Order Quantity - the optimal order quantity that minimizes total inventory costs",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "annual_demand": {
+                        "type": "number",
+                        "description": "Annual demand in units"
+                    },
+                    "order_cost": {
+                        "type": "number",
+                        "description": "Cost per order (fixed cost)"
+                    },
+                    "holding_cost": {
+                        "type": "number",
+                        "description": "Annual holding cost per unit"
                     }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "calculate_reorder_point",
-                    "description": "Calculate the reorder point - the inventory level at which a new order should be placed",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "daily_demand": {
-                                "type": "number",
-                                "description": "Average daily demand in units"
-                            },
-                            "lead_time_days": {
-                                "type": "number",
-                                "description": "Lead time in days"
-                            },
-                            "safety_stock": {
-                                "type": "number",
-                                "description": "Safety stock in units (optional)",
-                                "default": 0
-                            }
-                        },
-                        "required": ["daily_demand", "lead_time_days"]
+                },
+                "required": ["annual_demand", "order_cost", "holding_cost"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "calculate_reorder_point",
+            "description": "Calculate the reorder point - the inventory level at which a new order should be placed",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "daily_demand": {
+                        "type": "number",
+                        "description": "Average daily demand in units"
+                    },
+                    "lead_time_days": {
+                        "type": "number",
+                        "description": "Lead time in days"
+                    },
+                    "safety_stock": {
+                        "type": "number",
+                        "description": "Safety stock in units (optional)",
+                        "default": 0
                     }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "calculate_safety_stock",
-                    "description": "Calculate safety stock based on demand variability and desired service level",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "daily_demand": {
-                                "type": "number",
-                                "description": "Average daily demand in units"
-                            },
-                            "demand_std_dev": {
-                                "type": "number",
-                                "description": "Standard deviation of daily demand"
-                            },
-                            "lead_time_days": {
-                                "type": "number",
-                                "description": "Lead time in days"
-                            },
-                            "service_level": {
-                                "type": "number",
-                                "description": "Desired service level (e.g., 0.95 for 95%)",
-                                "default": 0.95
-                            }
-                        },
-                        "required": ["daily_demand", "demand_std_dev", "lead_time_days"]
+                },
+                "required": ["daily_demand", "lead_time_days"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "calculate_safety_stock",
+            "description": "Calculate safety stock based on demand variability and desired service level",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "daily_demand": {
+                        "type": "number",
+                        "description": "Average daily demand in units"
+                    },
+                    "demand_std_dev": {
+                        "type": "number",
+                        "description": "Standard deviation of daily demand"
+                    },
+                    "lead_time_days": {
+                        "type": "number",
+                        "description": "Lead time in days"
+                    },
+                    "service_level": {
+                        "type": "number",
+                        "description": "Desired service level (e.g., 0.95 for 95%)",
+                        "default": 0.95
                     }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "analyze_inventory_turnover",
-                    "description": "Analyze inventory turnover rate and provide insights",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "cost_of_goods_sold": {
-                                "type": "number",
-                                "description": "Annual cost of goods sold"
-                            },
-                            "average_inventory_value": {
-                                "type": "number",
-                                "description": "Average inventory value"
-                            }
-                        },
-                        "required": ["cost_of_goods_sold", "average_inventory_value"]
+                },
+                "required": ["daily_demand", "demand_std_dev", "lead_time_days"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "calculate_eoq_batch",
+            "description": "Calculate Economic Order Quantity for many SKUs at once. Each list holds one value per SKU; a one-element list applies to every SKU",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "annual_demand": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Annual demand in units per SKU"
+                    },
+                    "order_cost": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Cost per order (fixed cost) per SKU"
+                    },
+                    "holding_cost": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Annual holding cost per unit per SKU"
                     }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "forecast_demand",
-                    "description": "Forecast future demand based on historical data",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "historical_demand": {
-                                "type": "array",
-                                "items": {"type": "number"},
-                                "description": "Array of historical demand values"
-                            },
-                            "periods_ahead": {
-                                "type": "integer",
-                                "description": "Number of periods to forecast",
-                                "default": 1
-                            }
-                        },
-                        "required": ["historical_demand"]
+                },
+                "required": ["annual_demand", "order_cost", "holding_cost"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "calculate_reorder_point_batch",
+            "description": "Calculate reorder points for many SKUs at once. Each list holds one value per SKU; a one-element list applies to every SKU",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "daily_demand": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Average daily demand in units per SKU"
+                    },
+                    "lead_time_days": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Lead time in days per SKU"
+                    },
+                    "safety_stock": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Safety stock in units per SKU (optional)"
                     }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "abc_classification",
-                    "description": "Classify inventory items using ABC analysis (Pareto principle). A=high value, B=medium value, C=low value",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "items": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "sku": {"type": "string"},
-                                        "annual_value": {"type": "number"}
-                                    }
-                                },
-                                "description": "Array of SKUs with annual dollar values"
+                },
+                "required": ["daily_demand", "lead_time_days"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "calculate_safety_stock_batch",
+            "description": "Calculate safety stock for many SKUs at once. Each list holds one value per SKU; a one-element list applies to every SKU",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "daily_demand": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Average daily demand in units per SKU"
+                    },
+                    "demand_std_dev": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Standard deviation of daily demand per SKU"
+                    },
+                    "lead_time_days": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Lead time in days per SKU"
+                    },
+                    "service_level": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Desired service level per SKU (e.g., [0.95])",
+                        "default": [0.95]
+                    }
+                },
+                "required": ["daily_demand", "demand_std_dev", "lead_time_days"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "plan_inventory_batch",
+            "description": "Compute EOQ, safety stock and reorder point for many SKUs in one call. Pass one parallel list per field, in the same SKU order",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "sku_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "SKU identifiers"
+                    },
+                    "annual_demand": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Annual demand in units per SKU"
+                    },
+                    "order_cost": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Cost per order per SKU"
+                    },
+                    "holding_cost": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Annual holding cost per unit per SKU"
+                    },
+                    "lead_time_days": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Lead time in days per SKU"
+                    },
+                    "demand_std_dev": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Standard deviation of daily demand per SKU"
+                    },
+                    "service_level": {
+                        "type": "number",
+                        "description": "Desired service level for all SKUs (e.g., 0.95 for 95%)",
+                        "default": 0.95
+                    }
+                },
+                "required": ["sku_ids", "annual_demand", "order_cost", "holding_cost",
+                             "lead_time_days", "demand_std_dev"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "analyze_inventory_turnover",
+            "description": "Analyze inventory turnover rate and provide insights",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "cost_of_goods_sold": {
+                        "type": "number",
+                        "description": "Annual cost of goods sold"
+                    },
+                    "average_inventory_value": {
+                        "type": "number",
+                        "description": "Average inventory value"
+                    }
+                },
+                "required": ["cost_of_goods_sold", "average_inventory_value"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "forecast_demand",
+            "description": "Forecast future demand based on historical data",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "historical_demand": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Array of historical demand values"
+                    },
+                    "periods_ahead": {
+                        "type": "integer",
+                        "description": "Number of periods to forecast",
+                        "default": 1
+                    },
+                    "method": {
+                        "type": "string",
+                        "enum": ["moving_average", "holt"],
+                        "description": "moving_average (recent average plus half-over-half trend) or holt (exponential smoothing with a damped trend, weights recent periods more)",
+                        "default": "moving_average"
+                    },
+                    "alpha": {
+                        "type": "number",
+                        "description": "Holt level smoothing factor between 0 and 1",
+                        "default": 0.3
+                    },
+                    "beta": {
+                        "type": "number",
+                        "description": "Holt trend smoothing factor between 0 and 1",
+                        "default": 0.1
+                    },
+                    "phi": {
+                        "type": "number",
+                        "description": "Holt trend damping factor between 0 and 1 (1 = undamped linear trend)",
+                        "default": 0.95
+                    }
+                },
+                "required": ["historical_demand"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "abc_classification",
+            "description": "Classify inventory items using ABC analysis (Pareto principle). A=high value, B=medium value, C=low value",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "sku": {"type": "string"},
+                                "annual_value": {"type": "number"}
                             }
                         },
-                        "required": ["items"]
+                        "description": "Array of SKUs with annual dollar values"
                     }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "pareto_analysis_inventory",
-                    "description": "Perform Pareto analysis (80/20 rule) on inventory to identify vital few items",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "items": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "sku": {"type": "string"},
-                                        "metric_value": {"type": "number"}
-                                    }
-                                },
-                                "description": "Items with metric (sales, turns, value, etc.)"
-                            },
-                            "metric_name": {"type": "string", "description": "Name of the metric being analyzed"}
+                },
+                "required": ["items"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "pareto_analysis_inventory",
+            "description": "Perform Pareto analysis (80/20 rule) on inventory to identify vital few items",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "sku": {"type": "string"},
+                                "metric_value": {"type": "number"}
+                            }
                         },
-                        "required": ["items"]
-                    }
-                }
+                        "description": "Items with metric (sales, turns, value, etc.)"
+                    },
+                    "metric_name": {"type": "string", "description": "Name of the metric being analyzed"}
+                },
+                "required": ["items"]
             }
-        ]
-
-    def _execute_function(self, function_name: str, arguments: Dict[str, Any]) -> Any:
-        """Execute inventory management functions"""
-
-        if function_name == "calculate_eoq":
-            return self._calculate_eoq(**arguments)
+        }
+    }
+]
 
-        elif function_name == "calculate_reorder_point":
-            return self._calculate_reorder_point(**arguments)
 
-        elif function_name == "calculate_safety_stock":
-            return self._calculate_safety_stock(**arguments)
+class InventoryAgent(BaseAgent):
+    """
+    Inventory management agent with specialized tools for:
+    - Stock level analysis
+    - EOQ (Economic Order Quantity) calculation
+    - Reorder point determination
+    - Safety stock calculation
+    - Demand forecasting
+    """
 
-        elif function_name == "analyze_inventory_turnover":
-            return self._analyze_inventory_turnover(**arguments)
+    # Default smoothing factors for Holt's trend forecast (phi < 1 damps the trend)
+    HOLT_ALPHA = 0.3
+    HOLT_BETA = 0.1
+    HOLT_PHI = 0.95
+
+    # Reorder-point and safety-stock batches compute in float32, which halves
+    # memory traffic over large SKU arrays. float32 spacing grows with magnitude
+    # (about 0.06 near 1e6), so those unit counts are only exact to the cent
+    # below ~1e5; the EOQ batch produces costs and stays in float64 (COST_DTYPE)
+    BATCH_DTYPE = np.float32
+    COST_DTYPE = np.float64
+
+    def __init__(self, config: AgentConfig, api_key: str, async_client: Optional[AsyncOpenAI] = None):
+        super().__init__(config, api_key, async_client=async_client)
+        # Tool name -> bound calculator, so dispatch is one dict lookup
+        self._functions = {
+            "calculate_eoq": self._calculate_eoq,
+            "calculate_reorder_point": self._calculate_reorder_point,
+            "calculate_safety_stock": self._calculate_safety_stock,
+            "calculate_eoq_batch": self._calculate_eoq_batch,
+            "calculate_reorder_point_batch": self._calculate_reorder_point_batch,
+            "calculate_safety_stock_batch": self._calculate_safety_stock_batch,
+            "plan_inventory_batch": self._plan_inventory_batch,
+            "analyze_inventory_turnover": self._analyze_inventory_turnover,
+            "forecast_demand": self._forecast_demand,
+            "abc_classification": self._abc_classification,
+            "pareto_analysis_inventory": self._pareto_analysis_inventory
+        }
 
-        elif function_name == "forecast_demand":
-            return self._forecast_demand(**arguments)
+    def _get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
 
-        elif function_name == "abc_classification":
-            return self._abc_classification(**arguments)
+    def _get_tools(self) -> List[Dict[str, Any]]:
+        return _TOOLS
 
-        elif function_name == "pareto_analysis_inventory":
-            return self._pareto_analysis_inventory(**arguments)
+    def _execute_function(self, function_name: str, arguments: Dict[str, Any]) -> Any:
+        """Execute inventory management functions, rounding the result once on the way out"""
+        try:
+            return _fmt(self._call_function(function_name, arguments))
+        except Exception as e:
+            return {"error": str(e)}
 
-        else:
+    def _call_function(self, function_name: str, arguments: Dict[str, Any]) -> Any:
+        """Dispatch a tool call to its calculator, returning unrounded values"""
+        function = self._functions.get(function_name)
+        if function is None:
             return {"error": f"Unknown function: {function_name}"}
+        return function(**arguments)
 
     def _calculate_eoq(self, annual_demand: float, order_cost: float, holding_cost: float) -> Dict[str, Any]:
         """Calculate Economic Order Quantity"""
-        try:
-            # EOQ = sqrt((2 * D * S) / H)
-            # D = annual demand, S = order cost, H = holding cost
-            eoq = math.sqrt((2 * annual_demand * order_cost) / holding_cost)
-
-            # Calculate related metrics
-            orders_per_year = annual_demand / eoq
-            time_between_orders = 365 / orders_per_year
-            total_cost = (annual_demand / eoq) * order_cost + (eoq / 2) * holding_cost
-
-            return {
-                "eoq": round(eoq, 2),
-                "orders_per_year": round(orders_per_year, 2),
-                "days_between_orders": round(time_between_orders, 2),
-                "total_annual_cost": round(total_cost, 2),
-                "average_inventory": round(eoq / 2, 2)
-            }
-        except Exception as e:
-            return {"error": str(e)}
+        if annual_demand <= 0 or order_cost <= 0 or holding_cost <= 0:
+            return {"error": "annual_demand, order_cost and holding_cost must all be positive"}
+
+        eoq, orders_per_year, time_between_orders, total_cost = _eoq_core(
+            annual_demand, order_cost, holding_cost
+        )
+
+        return {
+            "eoq": eoq,
+            "orders_per_year": orders_per_year,
+            "days_between_orders": time_between_orders,
+            "total_annual_cost": total_cost,
+            "average_inventory": eoq / 2
+        }
 
     def _calculate_reorder_point(self, daily_demand: float, lead_time_days: float, safety_stock: float = 0) -> Dict[str, Any]:
         """Calculate reorder point"""
-        try:
-            # ROP = (Daily Demand * Lead Time) + Safety Stock
-            rop = (daily_demand * lead_time_days) + safety_stock
-
-            return {
-                "reorder_point": round(rop, 2),
-                "lead_time_demand": round(daily_demand * lead_time_days, 2),
-                "safety_stock": round(safety_stock, 2),
-                "recommendation": f"Place order when inventory reaches {round(rop, 2)} units"
-            }
-        except Exception as e:
-            return {"error": str(e)}
+        if daily_demand < 0 or lead_time_days < 0:
+            return {"error": "daily_demand and lead_time_days must not be negative"}
+
+        # ROP = (Daily Demand * Lead Time) + Safety Stock
+        rop = (daily_demand * lead_time_days) + safety_stock
+
+        return {
+            "reorder_point": rop,
+            "lead_time_demand": daily_demand * lead_time_days,
+            "safety_stock": safety_stock,
+            "recommendation": f"Place order when inventory reaches {round(rop, 2)} units"
+        }
 
     def _calculate_safety_stock(self, daily_demand: float, demand_std_dev: float,
                                  lead_time_days: float, service_level: float = 0.95) -> Dict[str, Any]:
         """Calculate safety stock for desired service level"""
-        try:
-            # Z-scores for common service levels
-            z_scores = {
-                0.90: 1.28,
-                0.95: 1.65,
-                0.97: 1.88,
-                0.99: 2.33,
-                0.999: 3.09
-            }
-
-            # Get Z-score for service level
-            z_score = z_scores.get(service_level, 1.65)  # Default to 95%
+        if not 0 < service_level < 1:
+            return {"error": "service_level must be between 0 and 1"}
+        if demand_std_dev < 0 or lead_time_days < 0:
+            return {"error": "demand_std_dev and lead_time_days must not be negative"}
+
+        # Z-score from the standard normal inverse CDF, exact for any service level
+        z_score = _z_score(service_level)
+
+        # Safety Stock = Z * σ * sqrt(L)
+        # σ = demand standard deviation, L = lead time
+        safety_stock = z_score * demand_std_dev * math.sqrt(lead_time_days)
+
+        return {
+            "safety_stock": safety_stock,
+            "service_level": service_level,
+            "z_score": z_score,
+            "expected_stockout_probability": 1 - service_level,
+            "recommendation": f"Maintain {round(safety_stock, 2)} units as safety stock for {service_level * 100:g}% service level"
+        }
+
+    def _calculate_eoq_batch(self, annual_demand: List[float], order_cost: List[float],
+                             holding_cost: List[float]) -> Dict[str, Any]:
+        """Calculate Economic Order Quantity for an array of SKUs"""
+        demand, order, holding = np.broadcast_arrays(
+            *(np.asarray(v, dtype=self.COST_DTYPE) for v in (annual_demand, order_cost, holding_cost))
+        )
+        if (demand <= 0).any() or (order <= 0).any() or (holding <= 0).any():
+            return {"error": "annual_demand, order_cost and holding_cost must all be positive"}
+
+        two_ds = 2 * demand * order
+        eoq = np.sqrt(two_ds / holding)
+        orders_per_year = demand / eoq
+        total_cost = np.sqrt(two_ds * holding)
+
+        return {
+            "eoq": eoq,
+            "orders_per_year": orders_per_year,
+            "days_between_orders": 365 / orders_per_year,
+            "total_annual_cost": total_cost,
+            "average_inventory": eoq / 2,
+            "total_cost_all_skus": float(total_cost.sum())
+        }
+
+    def _calculate_reorder_point_batch(self, daily_demand: List[float], lead_time_days: List[float],
+                                       safety_stock: Optional[List[float]] = None) -> Dict[str, Any]:
+        """Calculate reorder points for an array of SKUs"""
+        demand, lead_time, safety = np.broadcast_arrays(
+            np.asarray(daily_demand, dtype=self.BATCH_DTYPE),
+            np.asarray(lead_time_days, dtype=self.BATCH_DTYPE),
+            np.asarray(safety_stock if safety_stock is not None else 0.0, dtype=self.BATCH_DTYPE)
+        )
+        if (demand < 0).any() or (lead_time < 0).any():
+            return {"error": "daily_demand and lead_time_days must not be negative"}
+
+        lead_time_demand = demand * lead_time
+        rop = lead_time_demand + safety
+
+        return {
+            "reorder_point": rop,
+            "lead_time_demand": lead_time_demand,
+            "safety_stock": safety
+        }
+
+    def _calculate_safety_stock_batch(self, daily_demand: List[float], demand_std_dev: List[float],
+                                      lead_time_days: List[float],
+                                      service_level: Optional[List[float]] = None) -> Dict[str, Any]:
+        """Calculate safety stock for an array of SKUs"""
+        # daily_demand does not enter the formula but fixes the number of SKUs
+        _, std_dev, lead_time, level = np.broadcast_arrays(
+            np.asarray(daily_demand, dtype=self.BATCH_DTYPE),
+            np.asarray(demand_std_dev, dtype=self.BATCH_DTYPE),
+            np.asarray(lead_time_days, dtype=self.BATCH_DTYPE),
+            # Service levels stay float64: they are echoed back unrounded
+            np.asarray(service_level if service_level is not None else 0.95, dtype=np.float64)
+        )
+        if ((level <= 0) | (level >= 1)).any():
+            return {"error": "service_level must be between 0 and 1"}
+        if (std_dev < 0).any() or (lead_time < 0).any():
+            return {"error": "demand_std_dev and lead_time_days must not be negative"}
+
+        z_scores = norm.ppf(level).round(3)
+        safety_stock = z_scores.astype(self.BATCH_DTYPE) * std_dev * np.sqrt(lead_time)
+
+        return {
+            "safety_stock": safety_stock,
+            "service_level": level,
+            "z_score": z_scores,
+            "expected_stockout_probability": 1 - level
+        }
+
+    def _plan_inventory_batch(self, sku_ids: List[str], annual_demand: List[float], order_cost: List[float],
+                              holding_cost: List[float], lead_time_days: List[float],
+                              demand_std_dev: List[float], service_level: float = 0.95) -> Dict[str, Any]:
+        """Plan EOQ, safety stock and reorder point for a column-oriented set of SKUs"""
+        snapshot = InventorySnapshot(sku_ids, annual_demand, order_cost, holding_cost,
+                                     lead_time_days, demand_std_dev)
+        return self.plan_snapshot(snapshot, service_level)
+
+    def plan_snapshot(self, snapshot: InventorySnapshot, service_level: float = 0.95) -> Dict[str, Any]:
+        """
+        Plan EOQ, safety stock and reorder point for every SKU in a snapshot.
 
-            # Safety Stock = Z * σ * sqrt(L)
-            # σ = demand standard deviation, L = lead time
-            safety_stock = z_score * demand_std_dev * math.sqrt(lead_time_days)
+        Args:
+            snapshot: Column-oriented SKU data (see InventorySnapshot.from_records)
+            service_level: Desired service level for all SKUs
 
-            return {
-                "safety_stock": round(safety_stock, 2),
-                "service_level": service_level,
-                "z_score": z_score,
-                "expected_stockout_probability": round(1 - service_level, 4),
-                "recommendation": f"Maintain {round(safety_stock, 2)} units as safety stock for {int(service_level * 100)}% service level"
-            }
-        except Exception as e:
-            return {"error": str(e)}
+        Returns:
+            Dictionary with sku_ids and one ndarray per metric
+        """
+        if not 0 < service_level < 1:
+            return {"error": "service_level must be between 0 and 1"}
+        if ((snapshot.annual_demand <= 0).any() or (snapshot.order_cost <= 0).any()
+                or (snapshot.holding_cost <= 0).any()):
+            return {"error": "annual_demand, order_cost and holding_cost must all be positive"}
+        if (snapshot.demand_std_dev < 0).any() or (snapshot.lead_time_days < 0).any():
+            return {"error": "demand_std_dev and lead_time_days must not be negative"}
+
+        planned = {"sku_ids": snapshot.sku_ids, "service_level": service_level}
+        planned.update(_plan_snapshot(snapshot, service_level))
+        return planned
 
     def _analyze_inventory_turnover(self, cost_of_goods_sold: float, average_inventory_value: float) -> Dict[str, Any]:
         """Analyze inventory turnover rate"""
-        try:
-            # Inventory Turnover = COGS / Average Inventory
-            turnover_rate = cost_of_goods_sold / average_inventory_value
-            days_in_inventory = 365 / turnover_rate
-
-            # Determine performance
-            if turnover_rate > 12:
-                performance = "Excellent - Very fast moving inventory"
-            elif turnover_rate > 8:
-                performance = "Good - Healthy turnover rate"
-            elif turnover_rate > 4:
-                performance = "Moderate - Room for improvement"
-            else:
-                performance = "Low - Potential overstocking issues"
-
-            return {
-                "turnover_rate": round(turnover_rate, 2),
-                "days_in_inventory": round(days_in_inventory, 2),
-                "performance": performance,
-                "recommendation": self._get_turnover_recommendation(turnover_rate)
-            }
-        except Exception as e:
-            return {"error": str(e)}
-
-    def _get_turnover_recommendation(self, turnover_rate: float) -> str:
-        """Get recommendation based on turnover rate"""
-        if turnover_rate > 12:
-            return "Continue current practices. Monitor for potential stockouts."
-        elif turnover_rate > 8:
-            return "Good balance. Consider incremental improvements in forecasting."
-        elif turnover_rate > 4:
-            return "Review slow-moving items. Consider promotions or reduced order quantities."
+        if cost_of_goods_sold <= 0 or average_inventory_value <= 0:
+            return {"error": "cost_of_goods_sold and average_inventory_value must be positive"}
+
+        turnover_rate, days_in_inventory = _turnover_core(cost_of_goods_sold, average_inventory_value)
+
+        # One lookup gives the band for both performance and recommendation
+        band = bisect_left(_TURNOVER_BOUNDS, turnover_rate)
+
+        return {
+            "turnover_rate": turnover_rate,
+            "days_in_inventory": days_in_inventory,
+            "performance": _TURNOVER_PERFORMANCE[band],
+            "recommendation": _TURNOVER_RECOMMENDATIONS[band]
+        }
+
+    def _forecast_demand(self, historical_demand: List[float], periods_ahead: int = 1,
+                         method: str = "moving_average", alpha: float = HOLT_ALPHA,
+                         beta: float = HOLT_BETA, phi: float = HOLT_PHI) -> Dict[str, Any]:
+        """Moving average (default) or Holt linear trend forecast"""
+        demand = np.asarray(historical_demand, dtype=np.float64)
+        if demand.size < 3:
+            return {"error": "Insufficient historical data (need at least 3 periods)"}
+
+        if method == "holt":
+            return self._holt_forecast(demand, periods_ahead, alpha, beta, phi)
+        if method != "moving_average":
+            return {"error": f"Unknown forecast method: {method}"}
+
+        # Simple moving average (last 3 periods)
+        recent_avg = float(demand[-3:].sum()) / 3
+
+        # One pass over the series: the half sums give both the trend and the total
+        n = demand.size
+        half = n // 2
+        first_half = float(demand[:half].sum())
+        second_half = float(demand[half:].sum())
+        total = first_half + second_half
+
+        # Calculate trend
+        if n >= 6:
+            trend = second_half / (n - half) - first_half / half
         else:
-            return "Urgent: Review inventory levels. Implement discounting for slow movers and reduce new orders."
+            trend = 0.0
 
-    def _forecast_demand(self, historical_demand: List[float], periods_ahead: int = 1) -> Dict[str, Any]:
-        """Simple moving average forecast"""
-        try:
-            if len(historical_demand) < 3:
-                return {"error": "Insufficient historical data (need at least 3 periods)"}
+        # Forecast all periods in one vector expression (non-negative)
+        forecasts = np.maximum(0.0, recent_avg + trend * np.arange(1, periods_ahead + 1))
 
-            # Simple moving average (last 3 periods)
-            recent_avg = sum(historical_demand[-3:]) / 3
+        return {
+            "forecasts": forecasts,
+            "method": "Moving Average with Trend",
+            "historical_average": total / n,
+            "recent_average": recent_avg,
+            "trend": trend
+        }
 
-            # Calculate trend
-            if len(historical_demand) >= 6:
-                first_half_avg = sum(historical_demand[:len(historical_demand)//2]) / (len(historical_demand)//2)
-                second_half_avg = sum(historical_demand[len(historical_demand)//2:]) / (len(historical_demand) - len(historical_demand)//2)
-                trend = second_half_avg - first_half_avg
-            else:
-                trend = 0
-
-            # Forecast
-            forecasts = []
-            for i in range(periods_ahead):
-                forecast = recent_avg + (trend * (i + 1))
-                forecasts.append(max(0, round(forecast, 2)))  # Ensure non-negative
-
-            return {
-                "forecasts": forecasts,
-                "method": "Moving Average with Trend",
-                "historical_average": round(sum(historical_demand) / len(historical_demand), 2),
-                "recent_average": round(recent_avg, 2),
-                "trend": round(trend, 2)
-            }
-        except Exception as e:
-            return {"error": str(e)}
+    def _holt_forecast(self, demand: np.ndarray, periods_ahead: int, alpha: float, beta: float,
+                       phi: float) -> Dict[str, Any]:
+        """
+        Holt's damped trend (double exponential smoothing) forecast.
+
+        Each period updates the level and trend in O(1), so recent demand
+        counts more than in the plain moving average. With phi < 1 the trend
+        fades over the horizon instead of extrapolating linearly forever,
+        which avoids overforecasting far-out periods; phi = 1 is plain Holt.
+        """
+        if not (0 < alpha <= 1 and 0 < beta <= 1 and 0 < phi <= 1):
+            return {"error": "alpha, beta and phi must be between 0 and 1"}
+
+        level, trend = _holt_kernel(demand, float(alpha), float(beta), float(phi))
+
+        # h-step forecast: level + (phi + phi^2 + ... + phi^h) * trend
+        damping = np.cumsum(phi ** np.arange(1, periods_ahead + 1, dtype=np.float64))
+        forecasts = np.maximum(0.0, level + trend * damping)
+
+        return {
+            "forecasts": forecasts,
+            "method": "Holt Damped Trend" if phi < 1 else "Holt Linear Trend",
+            "historical_average": float(demand.mean()),
+            "recent_average": float(demand[-3:].mean()),
+            "level": float(level),
+            "trend": float(trend),
+            "alpha": alpha,
+            "beta": beta,
+            "phi": phi
+        }
 
     def _abc_classification(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -391,83 +849,81 @@ Use the provided functions to perform calculations. Always provide clear, action
         B items: Next 30% by value (typically 15-20% of total value)
         C items: Bottom 50% by value (typically 5-10% of total value)
         """
-        try:
-            if not items:
-                return {"error": "No items provided"}
-
-            # Sort by annual value descending
-            sorted_items = sorted(items, key=lambda x: x["annual_value"], reverse=True)
-
-            # Calculate total value and cumulative percentages
-            total_value = sum(item["annual_value"] for item in sorted_items)
-            cumulative = 0
-            results = []
-
-            for item in sorted_items:
-                value = item["annual_value"]
-                percent = (value / total_value) * 100
-                cumulative += percent
-
-                # Classify based on cumulative percentage
-                if cumulative <= 80:
-                    category = "A"
-                    priority = "High"
-                    control = "Tight inventory controls, frequent monitoring, accurate forecasting"
-                elif cumulative <= 95:
-                    category = "B"
-                    priority = "Medium"
-                    control = "Moderate controls, periodic review, standard forecasting"
-                else:
-                    category = "C"
-                    priority = "Low"
-                    control = "Basic controls, minimal monitoring, simple reorder systems"
-
-                results.append({
-                    "sku": item["sku"],
-                    "annual_value": round(value, 2),
-                    "percentage_of_total": round(percent, 2),
-                    "cumulative_percentage": round(cumulative, 2),
-                    "category": category,
-                    "priority": priority,
-                    "recommended_control": control
-                })
-
-            # Summarize by category
-            a_items = [r for r in results if r["category"] == "A"]
-            b_items = [r for r in results if r["category"] == "B"]
-            c_items = [r for r in results if r["category"] == "C"]
-
-            return {
-                "classification": results,
-                "summary": {
-                    "A_items": {
-                        "count": len(a_items),
-                        "percentage_of_items": round(len(a_items) / len(results) * 100, 1),
-                        "value_contribution": round(sum(i["percentage_of_total"] for i in a_items), 1),
-                        "management": "Tight controls - Daily/weekly monitoring, accurate forecasts, safety stock"
-                    },
-                    "B_items": {
-                        "count": len(b_items),
-                        "percentage_of_items": round(len(b_items) / len(results) * 100, 1),
-                        "value_contribution": round(sum(i["percentage_of_total"] for i in b_items), 1),
-                        "management": "Moderate controls - Monthly monitoring, standard forecasts"
-                    },
-                    "C_items": {
-                        "count": len(c_items),
-                        "percentage_of_items": round(len(c_items) / len(results) * 100, 1),
-                        "value_contribution": round(sum(i["percentage_of_total"] for i in c_items), 1),
-                        "management": "Basic controls - Quarterly review, simple reorder points"
-                    }
+        if not items:
+            return {"error": "No items provided"}
+
+        # Sort by annual value descending
+        sorted_items = sorted(items, key=lambda x: x["annual_value"], reverse=True)
+
+        # Calculate total value and cumulative percentages
+        total_value = sum(item["annual_value"] for item in sorted_items)
+        if total_value <= 0:
+            return {"error": "Total annual value must be positive"}
+        cumulative = 0
+        results = []
+
+        for item in sorted_items:
+            value = item["annual_value"]
+            percent = (value / total_value) * 100
+            cumulative += percent
+
+            # Classify based on cumulative percentage
+            if cumulative <= 80:
+                category = "A"
+                priority = "High"
+                control = "Tight inventory controls, frequent monitoring, accurate forecasting"
+            elif cumulative <= 95:
+                category = "B"
+                priority = "Medium"
+                control = "Moderate controls, periodic review, standard forecasting"
+            else:
+                category = "C"
+                priority = "Low"
+                control = "Basic controls, minimal monitoring, simple reorder systems"
+
+            results.append({
+                "sku": item["sku"],
+                "annual_value": round(value, 2),
+                "percentage_of_total": round(percent, 2),
+                "cumulative_percentage": round(cumulative, 2),
+                "category": category,
+                "priority": priority,
+                "recommended_control": control
+            })
+
+        # Summarize by category
+        a_items = [r for r in results if r["category"] == "A"]
+        b_items = [r for r in results if r["category"] == "B"]
+        c_items = [r for r in results if r["category"] == "C"]
+
+        return {
+            "classification": results,
+            "summary": {
+                "A_items": {
+                    "count": len(a_items),
+                    "percentage_of_items": round(len(a_items) / len(results) * 100, 1),
+                    "value_contribution": round(sum(i["percentage_of_total"] for i in a_items), 1),
+                    "management": "Tight controls - Daily/weekly monitoring, accurate forecasts, safety stock"
                 },
-                "recommendations": {
-                    "A_items": "Focus resources here - 20% of SKUs generating 80% of value",
-                    "B_items": "Maintain standard procedures - Moderate attention",
-                    "C_items": "Simplify management - Consider bulk orders or vendor-managed inventory"
+                "B_items": {
+                    "count": len(b_items),
+                    "percentage_of_items": round(len(b_items) / len(results) * 100, 1),
+                    "value_contribution": round(sum(i["percentage_of_total"] for i in b_items), 1),
+                    "management": "Moderate controls - Monthly monitoring, standard forecasts"
+                },
+                "C_items": {
+                    "count": len(c_items),
+                    "percentage_of_items": round(len(c_items) / len(results) * 100, 1),
+                    "value_contribution": round(sum(i["percentage_of_total"] for i in c_items), 1),
+                    "management": "Basic controls - Quarterly review, simple reorder points"
                 }
+            },
+            "recommendations": {
+                "A_items": "Focus resources here - 20% of SKUs generating 80% of value",
+                "B_items": "Maintain standard procedures - Moderate attention",
+                "C_items": "Simplify management - Consider bulk orders or vendor-managed inventory"
             }
-
-        except Exception as e:
-            return {"error": str(e)}
+        }
 
     def _pareto_analysis_inventory(self, items: List[Dict[str, Any]], metric_name: str = "value") -> Dict[str, Any]:
         """
@@ -475,53 +931,51 @@ Use the provided functions to perform calculations. Always provide clear, action
 
         Identifies the vital few SKUs that drive the metric (sales, turns, etc.).
         """
-        try:
-            if not items:
-                return {"error": "No items provided"}
-
-            # Sort by metric value descending
-            sorted_items = sorted(items, key=lambda x: x["metric_value"], reverse=True)
-
-            # Calculate cumulative percentages
-            total = sum(item["metric_value"] for item in sorted_items)
-            cumulative = 0
-            results = []
-
-            for item in sorted_items:
-                value = item["metric_value"]
-                percent = (value / total) * 100
-                cumulative += percent
-
-                results.append({
-                    "sku": item["sku"],
-                    "metric_value": round(value, 2),
-                    "percentage": round(percent, 2),
-                    "cumulative_percentage": round(cumulative, 2),
-                    "is_vital_few": cumulative <= 80,
-                    "rank": len(results) + 1
-                })
-
-            # Split into vital few and trivial many
-            vital_few = [r for r in results if r["is_vital_few"]]
-            trivial_many = [r for r in results if not r["is_vital_few"]]
-
-            return {
-                "metric": metric_name,
-                "analysis": results,
-                "vital_few": vital_few,
-                "trivial_many": trivial_many,
-                "summary": {
-                    "total_items": len(results),
-                    "vital_few_count": len(vital_few),
-                    "vital_few_percentage": round((len(vital_few) / len(results)) * 100, 1),
-                    "vital_few_contribution": round(sum(v["percentage"] for v in vital_few), 1),
-                    "trivial_many_count": len(trivial_many),
-                    "trivial_many_percentage": round((len(trivial_many) / len(results)) * 100, 1),
-                    "trivial_many_contribution": round(sum(t["percentage"] for t in trivial_many), 1)
-                },
-                "pareto_principle": f"{len(vital_few)} SKUs ({round((len(vital_few) / len(results)) * 100, 1)}%) generate {round(sum(v['percentage'] for v in vital_few), 1)}% of {metric_name}",
-                "recommendation": f"Focus inventory management resources on the top {len(vital_few)} SKUs which drive the majority of {metric_name}"
-            }
-
-        except Exception as e:
-            return {"error": str(e)}
+        if not items:
+            return {"error": "No items provided"}
+
+        # Sort by metric value descending
+        sorted_items = sorted(items, key=lambda x: x["metric_value"], reverse=True)
+
+        # Calculate cumulative percentages
+        total = sum(item["metric_value"] for item in sorted_items)
+        if total <= 0:
+            return {"error": "Total metric value must be positive"}
+        cumulative = 0
+        results = []
+
+        for item in sorted_items:
+            value = item["metric_value"]
+            percent = (value / total) * 100
+            cumulative += percent
+
+            results.append({
+                "sku": item["sku"],
+                "metric_value": round(value, 2),
+                "percentage": round(percent, 2),
+                "cumulative_percentage": round(cumulative, 2),
+                "is_vital_few": cumulative <= 80,
+                "rank": len(results) + 1
+            })
+
+        # Split into vital few and trivial many
+        vital_few = [r for r in results if r["is_vital_few"]]
+        trivial_many = [r for r in results if not r["is_vital_few"]]
+
+        return {
+            "metric": metric_name,
+            "analysis": results,
+            "vital_few": vital_few,
+            "trivial_many": trivial_many,
+            "summary": {
+                "total_items": len(results),
+                "vital_few_count": len(vital_few),
+                "vital_few_percentage": round((len(vital_few) / len(results)) * 100, 1),
+                "vital_few_contribution": round(sum(v["percentage"] for v in vital_few), 1),
+                "trivial_many_count": len(trivial_many),
+                "trivial_many_percentage": round((len(trivial_many) / len(results)) * 100, 1),
+                "trivial_many_contribution": round(sum(t["percentage"] for t in trivial_many), 1)
+            },
+            "pareto_principle": f"{len(vital_few)} SKUs ({round((len(vital_few) / len(results)) * 100, 1)}%) generate {round(sum(v['percentage'] for v in vital_few), 1)}% of {metric_name}",
+            "recommendation": f"Focus inventory management resources on the top {len(vital_few)} SKUs which drive the majority of {metric_name}"
+        }
@@ -0,0 +1,209 @@
+"""
+Knowledge Store - durable SQLite storage for the orchestrator knowledge base.
+
+Keeps knowledge-base entries on disk instead of in process memory so they
+survive restarts and memory stays flat regardless of uptime. The database
+runs in WAL mode and inserts are committed in small batches.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class KnowledgeStore:
+    """
+    SQLite-backed store with one append-only table per knowledge-base list.
+
+    Features:
+    - WAL journal so reads never block the writer
+    - Inserts batched into one transaction per FLUSH_ROWS rows or FLUSH_SECONDS,
+      with a timer committing a partial batch once inserts stop
+    - Row counts kept in memory, no COUNT(*) on status checks
+    """
+
+    # Pending inserts are committed once either limit is reached
+    FLUSH_ROWS = 100
+    FLUSH_SECONDS = 0.1
+
+    # Rows read per locked query while iterating a table
+    ITER_BATCH_ROWS = 500
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the database.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.logger = logging.getLogger(__name__)
+
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[Tuple[int, str]]] = {}
+        self._pending_rows = 0
+        self._last_flush = time.monotonic()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._counts: Dict[str, int] = {}
+
+        atexit.register(self.flush)
+
+    def table(self, name: str) -> "KnowledgeTable":
+        """
+        Get a list-like view of a table, creating the table if needed.
+
+        Args:
+            name: Table name (must be a valid identifier)
+
+        Returns:
+            KnowledgeTable for the given name
+        """
+        if not name.isidentifier():
+            raise ValueError(f"Invalid knowledge-base table name: {name}")
+
+        with self._lock:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {name} (ts INTEGER NOT NULL, data TEXT NOT NULL)"
+            )
+            if name not in self._counts:
+                self._counts[name] = self._conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+
+        return KnowledgeTable(self, name)
+
+    def insert(self, name: str, entry: Dict[str, Any]) -> None:
+        """
+        Queue an entry for insertion, committing the batch when it is due.
+
+        Args:
+            name: Table name
+            entry: JSON-serializable dictionary
+        """
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(entry).decode()
+        else:
+            data = json.dumps(entry, separators=(",", ":"))
+
+        with self._lock:
+            self._pending.setdefault(name, []).append((time.time_ns(), data))
+            self._pending_rows += 1
+            self._counts[name] += 1
+
+            if (self._pending_rows >= self.FLUSH_ROWS
+                    or time.monotonic() - self._last_flush >= self.FLUSH_SECONDS):
+                self._flush_locked()
+            elif self._flush_timer is None:
+                # Commit this batch within FLUSH_SECONDS even if no insert follows
+                self._flush_timer = threading.Timer(self.FLUSH_SECONDS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Commit all pending inserts"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """
+        Commit pending inserts in one transaction (caller holds the lock).
+
+        A failed commit is logged rather than raised into the caller that
+        happened to trigger it; the rows stay pending and the next flush
+        retries them.
+        """
+        self._last_flush = time.monotonic()
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending_rows:
+            return
+
+        try:
+            self._conn.execute("BEGIN")
+            for name, rows in self._pending.items():
+                self._conn.executemany(f"INSERT INTO {name} (ts, data) VALUES (?, ?)", rows)
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            self.logger.error(f"Knowledge store commit failed, keeping {self._pending_rows} rows pending: {e}")
+            if self._conn.in_transaction:
+                try:
+                    self._conn.execute("ROLLBACK")
+                except sqlite3.Error as rollback_error:
+                    self.logger.error(f"Knowledge store rollback failed: {rollback_error}")
+            return
+
+        self._pending.clear()
+        self._pending_rows = 0
+
+    def count(self, name: str) -> int:
+        """Number of entries in a table, including pending ones"""
+        return self._counts[name]
+
+    def iter_entries(self, name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a table's entries, oldest first.
+
+        Rows are read ITER_BATCH_ROWS at a time under the lock, so the shared
+        connection is never used by a writer mid-query and a slow consumer
+        does not hold the lock between batches.
+
+        Args:
+            name: Table name
+
+        Yields:
+            Stored entry dictionaries
+        """
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        query = f"SELECT rowid, data FROM {name} WHERE rowid > ? ORDER BY rowid LIMIT ?"
+        last_rowid = 0
+        with self._lock:
+            self._flush_locked()
+        while True:
+            with self._lock:
+                rows = self._conn.execute(query, (last_rowid, self.ITER_BATCH_ROWS)).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1][0]
+            for _, data in rows:
+                yield loads(data)
+
+    def close(self) -> None:
+        """Commit pending inserts and close the database"""
+        with self._lock:
+            self._flush_locked()
+            atexit.unregister(self.flush)
+            self._conn.close()
+
+
+class KnowledgeTable:
+    """Deque-like append()/len()/iteration view of one KnowledgeStore table"""
+
+    def __init__(self, store: KnowledgeStore, name: str):
+        self.store = store
+        self.name = name
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        self.store.insert(self.name, entry)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.store.iter_entries(self.name)
+
+    def __len__(self) -> int:
+        return self.store.count(self.name)
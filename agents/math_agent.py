@@ -4,8 +4,9 @@ Math Agent - OpenAI-powered mathematical analysis with SymPy integration.
 Specializes in complex calculations, optimization, and statistical analysis.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from agents.base_agent import BaseAgent, AgentConfig
+from openai import AsyncOpenAI
 import sympy
 from sympy import symbols, solve, simplify, integrate, diff
 import math
@@ -14,8 +15,8 @@ import math
 class MathAgent(BaseAgent):
     """Mathematical agent with SymPy for symbolic computation"""
 
-    def __init__(self, config: AgentConfig, api_key: str):
-        super().__init__(config, api_key)
+    def __init__(self, config: AgentConfig, api_key: str, async_client: Optional[AsyncOpenAI] = None):
+        super().__init__(config, api_key, async_client=async_client)
         # Initialize common symbolic variables
         self.x, self.y, self.z = symbols('x y z')
 
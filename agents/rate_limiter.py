@@ -0,0 +1,142 @@
+"""
+Rate Limiter - client-side request and token throttling for LLM calls.
+
+Keeps calls under the account's requests-per-minute and tokens-per-minute
+limits by waiting before a request is sent, instead of sending it, getting
+a 429 and backing off, and caps how many requests are in flight at once.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket usable from both threads and coroutines.
+
+    Features:
+    - Holds up to one minute's allowance and refills continuously
+    - Capacity is reserved up front, so concurrent callers queue fairly
+    - Requests larger than the bucket wait for the shortfall instead of failing
+    """
+
+    def __init__(self, per_minute: float):
+        """
+        Initialize the bucket full.
+
+        Args:
+            per_minute: Allowance per minute (e.g. an RPM or TPM limit)
+        """
+        self.capacity = float(per_minute)
+        self.refill_rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, n: float) -> float:
+        """Take n tokens (going negative if short) and return the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_rate)
+            self.last = now
+            self.tokens -= n
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.refill_rate
+
+    def acquire(self, n: float = 1) -> None:
+        """
+        Block until n tokens are available.
+
+        Args:
+            n: Number of tokens to take
+        """
+        wait = self._reserve(n)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, n: float = 1) -> None:
+        """
+        Wait without blocking the event loop until n tokens are available.
+
+        Args:
+            n: Number of tokens to take
+        """
+        wait = self._reserve(n)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class ConcurrencyLimiter:
+    """
+    Cap on in-flight async requests, shared across threads and event loops.
+
+    Unlike asyncio.Semaphore, which binds to the first loop that waits on it,
+    one limiter can be awaited from any loop (the orchestrator's background
+    loop, a web server's loop, ...) and still enforces a single global cap.
+
+    Features:
+    - Used as ``async with limiter:`` around the request
+    - Waiters are served first-come first-served, each on its own loop
+    - A released slot goes straight to the next waiter
+    """
+
+    def __init__(self, limit: int):
+        """
+        Initialize the limiter with every slot free.
+
+        Args:
+            limit: Requests allowed in flight at once
+        """
+        self.limit = limit
+        self._active = 0
+        self._waiters = deque()  # (loop, future) pairs, oldest first
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> "ConcurrencyLimiter":
+        with self._lock:
+            if self._active < self.limit and not self._waiters:
+                self._active += 1
+                return self
+            loop = asyncio.get_running_loop()
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            if not waiter[1].cancelled():
+                # The slot was handed over just before the cancellation landed
+                self._release()
+            # Otherwise _grant() sees the cancelled future and passes the slot on
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._release()
+
+    def _release(self) -> None:
+        """Hand the caller's slot to the next waiter, or free it"""
+        with self._lock:
+            while self._waiters:
+                loop, future = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(self._grant, future)
+                    return
+                except RuntimeError:
+                    # The waiter's loop is closed; try the next one
+                    continue
+            self._active -= 1
+
+    def _grant(self, future: asyncio.Future) -> None:
+        """Wake a waiter on its own loop (the slot is already counted as taken)"""
+        if future.cancelled():
+            self._release()
+        else:
+            future.set_result(None)
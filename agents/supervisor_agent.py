@@ -4,14 +4,34 @@ Supervisor Agent - OpenAI-powered agent routing and coordination.
 Coordinates between specialized agents and validates their outputs.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from agents.base_agent import BaseAgent, AgentConfig
+from openai import AsyncOpenAI
 import json
+import re
 
 
 class SupervisorAgent(BaseAgent):
     """Supervisor agent for routing queries and coordinating multi-agent workflows"""
 
+    # Keywords for routing, built once rather than on every query
+    ROUTING_KEYWORDS = {
+        "inventory": ("stock", "inventory", "eoq", "reorder", "demand", "forecast", "sku", "safety stock"),
+        "operations": ("workflow", "process", "productivity", "throughput", "cycle time", "labor", "equipment", "efficiency"),
+        "math": ("calculate", "optimize", "formula", "equation", "statistical", "algorithm", "compute")
+    }
+
+    # All keywords in one pattern, so a query is scanned once instead of once
+    # per keyword. The lookahead lets overlapping keywords ("safety stock" and
+    # "stock") both match; longer keywords come first in the alternation.
+    _KEYWORD_AGENTS = {kw: agent for agent, keywords in ROUTING_KEYWORDS.items() for kw in keywords}
+    _ROUTING_PATTERN = re.compile(
+        "(?=(" + "|".join(re.escape(kw) for kw in sorted(_KEYWORD_AGENTS, key=len, reverse=True)) + "))"
+    )
+
+    def __init__(self, config: AgentConfig, api_key: str, async_client: Optional[AsyncOpenAI] = None):
+        super().__init__(config, api_key, async_client=async_client)
+
     def _get_system_prompt(self) -> str:
         return """You are the supervisor agent coordinating a team of specialized warehouse agents.
 
@@ -94,17 +114,10 @@ Always provide clear, actionable insights with proper context."""
         if function_name == "route_query":
             query = arguments["query"].lower()
 
-            # Keywords for routing
-            inventory_keywords = ["stock", "inventory", "eoq", "reorder", "demand", "forecast", "sku", "safety stock"]
-            operations_keywords = ["workflow", "process", "productivity", "throughput", "cycle time", "labor", "equipment", "efficiency"]
-            math_keywords = ["calculate", "optimize", "formula", "equation", "statistical", "algorithm", "compute"]
-
-            # Score each agent
-            scores = {
-                "inventory": sum(1 for kw in inventory_keywords if kw in query),
-                "operations": sum(1 for kw in operations_keywords if kw in query),
-                "math": sum(1 for kw in math_keywords if kw in query)
-            }
+            # Score each agent (each distinct keyword counts once)
+            scores = dict.fromkeys(self.ROUTING_KEYWORDS, 0)
+            for kw in set(self._ROUTING_PATTERN.findall(query)):
+                scores[self._KEYWORD_AGENTS[kw]] += 1
 
             # Determine routing
             max_score = max(scores.values())
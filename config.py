@@ -76,17 +76,27 @@ LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 # Application settings
 ENABLE_STREAMING = os.getenv('ENABLE_STREAMING', 'True').lower() == 'true'
 ENABLE_FUNCTION_CALLING = os.getenv('ENABLE_FUNCTION_CALLING', 'True').lower() == 'true'
+ENABLE_WARM_UP = os.getenv('ENABLE_WARM_UP', 'True').lower() == 'true'  # Open API connections at startup
 
 
 # Retry and timeout settings
 MAX_RETRIES = int(get_optional_env('MAX_RETRIES', '3'))
 TIMEOUT = int(get_optional_env('TIMEOUT', '30'))  # seconds
+AGENT_CALL_TIMEOUT = int(get_optional_env('AGENT_CALL_TIMEOUT', '300'))  # seconds for a whole async agent call (completions + tools)
+MAX_CONCURRENT_LLM_CALLS = int(get_optional_env('MAX_CONCURRENT_LLM_CALLS', '8'))  # In-flight API requests
+OPENAI_RPM_LIMIT = int(get_optional_env('OPENAI_RPM_LIMIT', '0'))  # Requests per minute per model (0 disables)
+OPENAI_TPM_LIMIT = int(get_optional_env('OPENAI_TPM_LIMIT', '0'))  # Tokens per minute per model (0 disables)
 
 
 # Agent orchestration settings
 ENABLE_AGENT_HANDOFFS = True
 ENABLE_PARALLEL_PROCESSING = True
 MAX_CONVERSATION_HISTORY = 10  # Number of exchanges to keep in memory
+KNOWLEDGE_BASE_MAX_ENTRIES = int(get_optional_env('KNOWLEDGE_BASE_MAX_ENTRIES', '2000'))  # Per knowledge-base list
+CONVERSATION_LOG_PATH = get_optional_env('CONVERSATION_LOG_PATH', '')  # NDJSON conversation log (empty keeps it in memory)
+KNOWLEDGE_BASE_DB_PATH = get_optional_env('KNOWLEDGE_BASE_DB_PATH', '')  # SQLite knowledge base (empty keeps it in memory; takes precedence over CONVERSATION_LOG_PATH)
+RESPONSE_CACHE_SIZE = int(get_optional_env('RESPONSE_CACHE_SIZE', '0'))  # Cached answers to repeated queries (opt-in)
+RESPONSE_CACHE_TTL = int(get_optional_env('RESPONSE_CACHE_TTL', '300'))  # seconds
 
 
 # Document processing settings
@@ -1,14 +1,12 @@
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from agents.inventory_agent import InventoryAgent
-from agents.operations_agent import OperationsAgent
-from agents.supervisor_agent import SupervisorAgent
-from agents.document_processor import DocumentProcessor
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 from agents.agent_orchestrator import AgentOrchestrator
 import uvicorn
 import signal
 import sys
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -17,26 +15,24 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("Shutting down server...")
+    orchestrator.close()
 
 app = FastAPI(lifespan=lifespan)
 
-# Initialize document processor and agents
-document_processor = DocumentProcessor()
-inventory_agent = InventoryAgent(document_processor=document_processor)
-operations_agent = OperationsAgent(document_processor=document_processor)
-supervisor_agent = SupervisorAgent(document_processor=document_processor)
-
-# Initialize orchestrator
-orchestrator = AgentOrchestrator(
-    inventory_agent=inventory_agent,
-    operations_agent=operations_agent,
-    supervisor_agent=supervisor_agent,
-    document_processor=document_processor
-)
+# The orchestrator builds the agents and document processor, which share
+# its API client pool and concurrency limit
+orchestrator = AgentOrchestrator()
+inventory_agent = orchestrator.agents["inventory"]
+operations_agent = orchestrator.agents["operations"]
+supervisor_agent = orchestrator.agents["supervisor"]
 
 class QueryModel(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
     query: str
     agent_type: str
+    # Sent as "validate"; renamed here so it does not shadow BaseModel.validate
+    validate_result: bool = Field(False, alias="validate")  # Opt in to supervisor validation of the result
 
 @app.post("/query")
 async def process_query(query_data: QueryModel):
@@ -48,8 +44,10 @@ async def process_query(query_data: QueryModel):
         else:
             raise HTTPException(status_code=400, detail="Invalid agent type")
         
-        # Supervisor validates the result
-        validation = supervisor_agent.validate_decision(query_data.agent_type, result)
+        # Supervisor validates the result only when the caller asks for it
+        validation = None
+        if query_data.validate_result:
+            validation = supervisor_agent.validate_decision(asdict(result))
         
         return {
             "result": result,
@@ -58,6 +56,17 @@ async def process_query(query_data: QueryModel):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/query/stream")
+async def stream_query(query_data: QueryModel):
+    if query_data.agent_type not in orchestrator.agents:
+        raise HTTPException(status_code=400, detail="Invalid agent type")
+
+    # Chunks are forwarded as they arrive from the requested agent
+    return StreamingResponse(
+        orchestrator.aprocess_query_stream(query_data.query, agent_name=query_data.agent_type),
+        media_type="text/plain"
+    )
+
 @app.get("/status")
 async def get_status():
     return {
@@ -0,0 +1,70 @@
+import unittest
+from agents.base_agent import AgentConfig
+from agents.inventory_agent import InventoryAgent, InventorySnapshot
+
+class TestInventoryAgentBatch(unittest.TestCase):
+    def setUp(self):
+        self.agent = InventoryAgent(AgentConfig(name="inventory"), api_key="test-key")
+
+    def test_eoq_batch_matches_scalar(self):
+        batch = self.agent._calculate_eoq_batch([1000, 500, 1200], [50], [2, 3, 4])
+
+        for i, (demand, holding) in enumerate([(1000, 2), (500, 3), (1200, 4)]):
+            single = self.agent._calculate_eoq(demand, 50, holding)
+            for key, value in single.items():
+                self.assertAlmostEqual(batch[key][i], value, places=2)
+
+    def test_eoq_batch_costs_exact_for_high_volume(self):
+        batch = self.agent._calculate_eoq_batch([5e11], [1000.37], [2.11])
+        single = self.agent._calculate_eoq(5e11, 1000.37, 2.11)
+
+        self.assertAlmostEqual(float(batch["total_annual_cost"][0]), single["total_annual_cost"], places=2)
+        self.assertAlmostEqual(float(batch["eoq"][0]), single["eoq"], places=2)
+
+    def test_reorder_point_batch_matches_scalar(self):
+        batch = self.agent._calculate_reorder_point_batch([10, 20], [5, 7], [3, 0])
+
+        for i, (demand, lead_time, safety) in enumerate([(10, 5, 3), (20, 7, 0)]):
+            single = self.agent._calculate_reorder_point(demand, lead_time, safety)
+            self.assertAlmostEqual(batch["reorder_point"][i], single["reorder_point"], places=2)
+
+    def test_safety_stock_batch_matches_scalar(self):
+        batch = self.agent._calculate_safety_stock_batch([10, 20], [3, 4], [4], [0.95, 0.925])
+
+        for i, (std_dev, level) in enumerate([(3, 0.95), (4, 0.925)]):
+            single = self.agent._calculate_safety_stock(0, std_dev, 4, level)
+            self.assertAlmostEqual(batch["safety_stock"][i], single["safety_stock"], places=2)
+            self.assertAlmostEqual(batch["z_score"][i], single["z_score"], places=3)
+
+    def test_plan_snapshot_from_records(self):
+        snapshot = InventorySnapshot.from_records([
+            {"sku_id": "A", "annual_demand": 3650, "order_cost": 50, "holding_cost": 2,
+             "lead_time_days": 4, "demand_std_dev": 3},
+            {"sku_id": "B", "annual_demand": 730, "order_cost": 20, "holding_cost": 1,
+             "lead_time_days": 9, "demand_std_dev": 1},
+        ])
+        plan = self.agent.plan_snapshot(snapshot)
+
+        self.assertEqual(plan["sku_ids"], ["A", "B"])
+        self.assertAlmostEqual(plan["eoq"][0], self.agent._calculate_eoq(3650, 50, 2)["eoq"], places=2)
+        self.assertAlmostEqual(plan["reorder_point"][0], 49.87, places=2)
+
+    def test_batch_rejects_invalid_inputs(self):
+        self.assertIn("error", self.agent._calculate_eoq_batch([1000, 0], [50], [2]))
+        self.assertIn("error", self.agent._calculate_safety_stock_batch([10], [3], [4], [1.0]))
+        self.assertIn("error", self.agent._calculate_safety_stock_batch([10, 20], [3, -1], [4]))
+        self.assertIn("error", self.agent._calculate_reorder_point_batch([10, -5], [4]))
+        self.assertIn("error", self.agent._calculate_reorder_point_batch([10], [-1]))
+        self.assertIn("error", self.agent._plan_inventory_batch(["A", "B"], [1000, 500], [50, 50], [2, 3],
+                                                                [5, 7], [3, -1]))
+        self.assertIn("error", self.agent._plan_inventory_batch(["A"], [1000], [50], [2], [-5], [3]))
+
+        # Shape mismatches raise, and _execute_function turns them into an error result
+        result = self.agent._execute_function(
+            "calculate_eoq_batch",
+            {"annual_demand": [1000, 500, 1], "order_cost": [50], "holding_cost": [2, 3]}
+        )
+        self.assertIn("error", result)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import os
+import unittest
+from unittest import mock
+
+# The app builds its orchestrator on import; keep that offline
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ["ENABLE_WARM_UP"] = "False"
+
+from fastapi.testclient import TestClient
+from agents.base_agent import AgentResponse
+import main
+
+class TestQueryEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(main.app)
+        response = AgentResponse(content="EOQ is 224 units", agent_name="inventory")
+        patcher = mock.patch.object(main.inventory_agent, "process", return_value=response)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_validation_is_opt_in(self):
+        result = self.client.post("/query", json={"query": "EOQ?", "agent_type": "inventory"})
+
+        self.assertEqual(result.status_code, 200)
+        self.assertIsNone(result.json()["validation"])
+
+    def test_validate_flag_runs_supervisor_validation(self):
+        result = self.client.post(
+            "/query", json={"query": "EOQ?", "agent_type": "inventory", "validate": True}
+        )
+
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(result.json()["result"]["content"], "EOQ is 224 units")
+        self.assertTrue(result.json()["validation"].startswith("Decision validated"))
+
+if __name__ == '__main__':
+    unittest.main()